@@ -5,19 +5,56 @@ n8n Cloud instance'ıyla güvenli ve verimli iletişim kurmak için HTTP client
 """
 
 import asyncio
-import json
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import random
+import time
+from collections import OrderedDict
+from contextlib import aclosing
+from functools import cached_property, reduce
+from typing import Optional, Dict, Any, List, Set, Tuple, AsyncIterator, Callable, ClassVar, FrozenSet
+from datetime import datetime, timezone
 import httpx
+import ijson
+import orjson
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 logger = structlog.get_logger(__name__)
 
+# Yerel arama için taranan maksimum workflow sayısı
+_SEARCH_SCAN_LIMIT = 100
+
+# Cache'te tutulacak maksimum girdi sayısı (LRU)
+_CACHE_MAX_ENTRIES = 1024
+
+# Cache key'i: (method, endpoint, sıralı parametre tuple'ı)
+CacheKey = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+
+# Tekrar denenebilir HTTP durum kodları (5xx dışında)
+_RETRYABLE_STATUS_CODES = {429}
+
+# 5xx veya yanıtsız kalan istek sonrası tekrar denemenin güvenli olduğu (idempotent) metodlar
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# İsteğin sunucuya hiç ulaşmadığı kesin olan transport hataları
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectTimeout, httpx.ConnectError, httpx.PoolTimeout)
+
+# Endpoint URL parçaları
+_WF_PREFIX = "/workflows/"
+_ACTIVATE = "/activate"
+_DEACTIVATE = "/deactivate"
+
 
 class WorkflowModel(BaseModel):
     """n8n Workflow modeli"""
+    # Türetilmiş değerler önbellekte tutulduğu için model değiştirilemez
+    model_config = ConfigDict(extra="ignore", populate_by_name=True, frozen=True)
+    
+    # cached_property ile önbelleğe alınan türetilmiş değerler (kopyalarda yeniden hesaplanır)
+    _DERIVED_CACHES: ClassVar[Tuple[str, ...]] = ("search_text", "summary")
+    
     id: Optional[str] = None
     name: str
     nodes: List[Dict[str, Any]] = Field(default_factory=list)
@@ -28,8 +65,95 @@ class WorkflowModel(BaseModel):
     tags: List[Dict[str, Any]] = Field(default_factory=list)
     pinData: Optional[Dict[str, Any]] = Field(default_factory=dict)
     versionId: Optional[str] = None
-    createdAt: Optional[datetime] = None
-    updatedAt: Optional[datetime] = None
+    createdAt: Optional[int] = None  # Unix epoch (ms)
+    updatedAt: Optional[int] = None  # Unix epoch (ms)
+    
+    @field_validator("createdAt", "updatedAt", mode="before")
+    @classmethod
+    def parse_timestamp(cls, value: Any) -> Any:
+        """ISO-8601 zaman damgalarını Unix epoch milisaniyesine çevir (saat dilimi yoksa UTC)"""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                # Yerel saat dilimine göre yorumlanmasın
+                value = value.replace(tzinfo=timezone.utc)
+            return round(value.timestamp() * 1000)
+        return value
+    
+    @property
+    def createdAt_dt(self) -> Optional[datetime]:
+        """createdAt değerini UTC datetime olarak döndür"""
+        if self.createdAt is None:
+            return None
+        return datetime.fromtimestamp(self.createdAt / 1000, tz=timezone.utc)
+    
+    @property
+    def updatedAt_dt(self) -> Optional[datetime]:
+        """updatedAt değerini UTC datetime olarak döndür"""
+        if self.updatedAt is None:
+            return None
+        return datetime.fromtimestamp(self.updatedAt / 1000, tz=timezone.utc)
+    
+    @cached_property
+    def search_text(self) -> str:
+        """Arama için küçük harfe çevrilmiş ad ve tag adları (NUL ile ayrılmış)"""
+        return "\0".join([self.name, *(tag.get("name", "") for tag in self.tags)]).lower()
+    
+    @cached_property
+    def summary(self) -> Dict[str, Any]:
+        """Listeleme yanıtlarında kullanılan kısa workflow özeti"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "active": self.active,
+            "nodes_count": len(self.nodes)
+        }
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "WorkflowModel":
+        """Kopyala; __dict__ ile kopyalanan türetilmiş önbellek değerlerini temizle"""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in self._DERIVED_CACHES:
+            copied.__dict__.pop(name, None)
+        return copied
+    
+    def fast_dump(self) -> Dict[str, Any]:
+        """
+        model_dump(mode="json", exclude_unset=True, exclude_none=True) eşdeğeri.
+        
+        Set edilmiş alan kümesine özel üretilip önbelleğe alınan bir fonksiyon kullanır.
+        """
+        fields = frozenset(self.model_fields_set)
+        dumper = _DUMPERS.get(fields) or _compile_dumper(fields)
+        return dumper(self)
+
+
+# Liste yanıtlarını tek seferde doğrulamak için
+_WORKFLOW_LIST_ADAPTER = TypeAdapter(List[WorkflowModel])
+
+# fast_dump için set edilmiş alan kümesi -> üretilmiş dump fonksiyonu
+_DUMPERS: Dict[FrozenSet[str], Callable[[WorkflowModel], Dict[str, Any]]] = {}
+
+
+def _compile_dumper(fields: FrozenSet[str]) -> Callable[[WorkflowModel], Dict[str, Any]]:
+    """Verilen alan kümesi için None alanları atlayan özel bir dump fonksiyonu üret"""
+    lines = ["def dump(model):", "    data = {}"]
+    
+    # Alan sırası model_dump ile aynı kalsın diye model_fields sırasıyla
+    for name in WorkflowModel.model_fields:
+        if name in fields:
+            lines.append(f"    value = model.{name}")
+            lines.append("    if value is not None:")
+            lines.append(f"        data[{name!r}] = value")
+    
+    lines.append("    return data")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    
+    dumper = namespace["dump"]
+    _DUMPERS[fields] = dumper
+    return dumper
 
 
 class N8nApiError(Exception):
@@ -41,6 +165,10 @@ class N8nApiError(Exception):
         super().__init__(self.message)
 
 
+class _LeaderCancelled(Exception):
+    """Birleştirilmiş isteği yapan çağrı iptal edildi; bekleyenler isteği kendileri tekrarlamalı"""
+
+
 class N8nApiClient:
     """
     n8n Cloud API Client
@@ -55,16 +183,42 @@ class N8nApiClient:
         api_key: str, 
         timeout: int = 30,
         max_retries: int = 3,
-        cache_ttl: int = 300
+        cache_ttl: int = 300,
+        max_concurrent_requests: int = 10
     ):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.cache_ttl = cache_ttl
+        self.max_concurrent_requests = max_concurrent_requests
+        
+        # Toplu isteklerde aynı anda yapılacak istek sayısını sınırla
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         
-        # Cache için basit memory storage
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Retry bekleme süreleri (decorrelated jitter, saniye)
+        self._retry_base = 0.1
+        self._retry_cap = 10.0
+        
+        # Cache için boyutu sınırlı LRU memory storage
+        self._cache: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._cache_max = _CACHE_MAX_ENTRIES
+        # Endpoint bazlı invalidation için endpoint -> cache key'leri
+        self._cache_keys_by_endpoint: Dict[str, Set[CacheKey]] = {}
+        # Süresi dolan girdileri tembel temizlemek için (expires_at, sıra, key) heap'i
+        self._cache_expiry: List[Tuple[float, int, CacheKey]] = []
+        self._cache_seq = itertools.count()
+        
+        # Aynı anda yapılan özdeş GET'leri tek isteğe indirmek için bekleyen future'lar
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        
+        # Arama için trigram index'i (3-gram -> workflow pozisyonları)
+        self._search_index: Dict[str, Set[int]] = {}
+        self._indexed_workflows: List[WorkflowModel] = []
+        self._index_source: Optional[Dict[str, Any]] = None
+        
+        # n8n'in sunucu taraflı aramayı destekleyip desteklemediği (None = henüz denenmedi)
+        self._server_search_supported: Optional[bool] = None
         
         # HTTP client yapılandırması
         self.client = httpx.AsyncClient(
@@ -75,9 +229,17 @@ class N8nApiClient:
                 "Accept": "application/json"
             },
             timeout=self.timeout,
+            http2=True,  # Eşzamanlı istekleri tek bağlantı üzerinden çoğulla
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60
+            ),
         )
         
-        logger.info("n8n API Client initialized", base_url=self.base_url)
+        # Sabit bağlamı bir kez bağla, her log çağrısında yeniden birleştirme
+        self._log = logger.bind(base_url=self.base_url)
+        self._log.info("n8n API Client initialized")
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -90,36 +252,127 @@ class N8nApiClient:
     async def close(self):
         """HTTP client'ı kapat"""
         await self.client.aclose()
-        logger.info("n8n API Client closed")
-    
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Cache'in geçerli olup olmadığını kontrol et"""
-        if cache_key not in self._cache:
-            return False
-        
-        cached_at = self._cache[cache_key].get("cached_at")
-        if not cached_at:
-            return False
-        
-        return datetime.now() - cached_at < timedelta(seconds=self.cache_ttl)
+        self._log.info("n8n API Client closed")
     
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Cache'den veri al"""
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key].get("data")
+    def _get_from_cache(self, cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Cache'den geçerli veriyi al"""
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry["expires_at"] > time.monotonic():
+            self._cache.move_to_end(cache_key)
+            return entry["data"]
         return None
     
-    def _set_cache(self, cache_key: str, data: Dict[str, Any]):
-        """Cache'e veri kaydet"""
+    def _set_cache(
+        self,
+        cache_key: CacheKey,
+        endpoint: str,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """Cache'e veri ve (varsa) koşullu istek doğrulayıcılarını kaydet"""
+        now = time.monotonic()
+        expires_at = now + self.cache_ttl
         self._cache[cache_key] = {
             "data": data,
-            "cached_at": datetime.now()
+            "endpoint": endpoint,
+            "expires_at": expires_at,
+            "etag": etag,
+            "last_modified": last_modified
         }
+        self._cache.move_to_end(cache_key)
+        self._cache_keys_by_endpoint.setdefault(endpoint, set()).add(cache_key)
+        heapq.heappush(self._cache_expiry, (expires_at, next(self._cache_seq), cache_key))
+        
+        # Kapasite aşıldıysa en az kullanılan girdiyi çıkar
+        if len(self._cache) > self._cache_max:
+            self._drop_cache_entry(next(iter(self._cache)))
+        
+        # Süresi dolmuş girdileri temizle (yenilenmiş girdilere ve koşullu
+        # istekle doğrulanabilecek girdilere dokunma, onları LRU sınırlar)
+        while self._cache_expiry and self._cache_expiry[0][0] <= now:
+            expired_at, _, expired_key = heapq.heappop(self._cache_expiry)
+            entry = self._cache.get(expired_key)
+            if (entry is not None and entry["expires_at"] == expired_at
+                    and not (entry["etag"] or entry["last_modified"])):
+                self._drop_cache_entry(expired_key)
+    
+    def _drop_cache_entry(self, cache_key: CacheKey):
+        """Tek bir cache girdisini ve endpoint kaydını sil"""
+        entry = self._cache.pop(cache_key, None)
+        if entry is None:
+            return
+        
+        keys = self._cache_keys_by_endpoint.get(entry["endpoint"])
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._cache_keys_by_endpoint[entry["endpoint"]]
+    
+    def _invalidate_cache(self, *endpoints: str):
+        """Sadece verilen endpoint'lere ait cache girdilerini temizle"""
+        for endpoint in endpoints:
+            for cache_key in self._cache_keys_by_endpoint.pop(endpoint, ()):
+                self._cache.pop(cache_key, None)
+        
+        # Arama index'i workflow listesinden türetildiği için onu da düşür
+        if "/workflows" in endpoints:
+            self._clear_search_index()
+        
+        self._log.debug("Cache invalidated", endpoints=endpoints)
+    
+    def _invalidate_workflow(self, workflow_id: Optional[str] = None):
+        """Workflow listesi ve (varsa) tekil workflow cache'ini temizle"""
+        if workflow_id is None:
+            self._invalidate_cache("/workflows")
+        else:
+            self._invalidate_cache("/workflows", _WF_PREFIX + workflow_id)
+    
+    @staticmethod
+    def _freeze_params(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+        """Parametreleri hashlenebilir, sıralı bir tuple'a çevir"""
+        if not params:
+            return ()
+        return tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in params.items()
+        ))
     
     def _clear_cache(self):
         """Cache'i temizle"""
         self._cache.clear()
-        logger.debug("Cache cleared")
+        self._cache_expiry.clear()
+        self._cache_keys_by_endpoint.clear()
+        self._clear_search_index()
+        self._log.debug("Cache cleared")
+    
+    def _clear_search_index(self):
+        """Arama index'ini temizle"""
+        self._search_index.clear()
+        self._indexed_workflows = []
+        self._index_source = None
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Metnin 3-gram kümesini döndür"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def _matches_query(workflow: WorkflowModel, query_lower: str) -> bool:
+        """Workflow adı veya tag'leri sorguyu içeriyor mu"""
+        return query_lower in workflow.search_text
+    
+    def _build_search_index(self, source: Dict[str, Any], workflows: List[WorkflowModel]):
+        """Workflow adları ve tag'leri üzerinden trigram index'i oluştur"""
+        self._clear_search_index()
+        
+        for position, workflow in enumerate(workflows):
+            for text in workflow.search_text.split("\0"):
+                for gram in self._trigrams(text):
+                    self._search_index.setdefault(gram, set()).add(position)
+        
+        self._indexed_workflows = workflows
+        self._index_source = source
     
     async def _make_request(
         self, 
@@ -130,175 +383,356 @@ class N8nApiClient:
         use_cache: bool = False
     ) -> Dict[str, Any]:
         """
-        HTTP isteği yap, retry mekanizması ve hata yönetimi ile
+        HTTP isteği yap, cache ve eşzamanlı istek birleştirme ile
         """
-        cache_key = f"{method}:{endpoint}:{json.dumps(params or {}, sort_keys=True)}"
+        # Cache ve birleştirme sadece GET istekleri için
+        if method.upper() != "GET" or not use_cache:
+            response = await self._send_request(method, endpoint, data, params)
+            return self._parse_response(response)
+        
+        cache_key = (method, endpoint, self._freeze_params(params))
+        
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data:
+            self._log.debug("Cache hit", endpoint=endpoint)
+            return cached_data
+        
+        # Aynı istek zaten yoldaysa yeni istek atma, onun sonucunu bekle
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self._log.debug("Joining in-flight request", endpoint=endpoint)
+            try:
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                # İsteği yapan çağrı iptal edildi, bu çağrı değil: isteği kendimiz yapalım
+                return await self._make_request(method, endpoint, data, params, use_cache)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        
+        # Süresi dolmuş ama doğrulayıcısı olan girdi varsa koşullu GET yap
+        stale_entry = self._cache.get(cache_key)
+        headers = {}
+        if stale_entry is not None:
+            if stale_entry["etag"]:
+                headers["If-None-Match"] = stale_entry["etag"]
+            if stale_entry["last_modified"]:
+                headers["If-Modified-Since"] = stale_entry["last_modified"]
         
-        # Cache kontrolü (sadece GET istekleri için)
-        if method.upper() == "GET" and use_cache:
-            cached_data = self._get_from_cache(cache_key)
-            if cached_data:
-                logger.debug("Cache hit", endpoint=endpoint)
-                return cached_data
+        try:
+            response = await self._send_request(method, endpoint, data, params, headers=headers or None)
+            
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            
+            if response.status_code == 304 and stale_entry is not None:
+                # Değişmemiş: gövdeyi parse etmeden cache'teki veriyi kullan
+                self._log.debug("Not modified, reusing cached data", endpoint=endpoint)
+                result = stale_entry["data"]
+                # 304 doğrulayıcıları göndermeyebilir, eskilerini koru
+                etag = etag or stale_entry["etag"]
+                last_modified = last_modified or stale_entry["last_modified"]
+            else:
+                result = self._parse_response(response)
+            
+            self._set_cache(cache_key, endpoint, result, etag=etag, last_modified=last_modified)
+        except asyncio.CancelledError:
+            # İptal sadece bu çağrıya aittir; bekleyenleri iptal etmek yerine yeniden denemeye yönlendir
+            self._inflight.pop(cache_key, None)
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Bekleyen yoksa "exception was never retrieved" uyarısını engelle
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        HTTP isteği yap, retry mekanizması ve hata yönetimi ile.
         
+        Başarılı (4xx/5xx olmayan) yanıtı parse etmeden döndürür.
+        """
+        log = self._log.bind(method=method, endpoint=endpoint)
         last_exception = None
+        last_sleep = self._retry_base
         
         for attempt in range(self.max_retries + 1):
+            retry_after = None
+            
             try:
-                logger.debug(
-                    "Making HTTP request", 
-                    method=method, 
-                    endpoint=endpoint, 
-                    attempt=attempt + 1
-                )
+                log.debug("Making HTTP request", attempt=attempt + 1)
                 
                 response = await self.client.request(
                     method=method,
                     url=endpoint,
-                    json=data,
-                    params=params
+                    content=orjson.dumps(data) if data is not None else None,
+                    params=params,
+                    headers=headers
                 )
                 
                 # HTTP hata kodları kontrolü
                 if response.status_code >= 400:
-                    error_data = None
-                    try:
-                        error_data = response.json()
-                    except Exception:
-                        error_data = {"message": response.text}
+                    error = self._api_error_from_response(response)
                     
-                    error_msg = f"n8n API error: {response.status_code}"
-                    if error_data and "message" in error_data:
-                        error_msg += f" - {error_data['message']}"
+                    # 4xx hataları (429 hariç) ve idempotent olmayan isteklerde 5xx tekrar denenmez
+                    if not self._is_retryable_status(response.status_code, method):
+                        raise error
                     
-                    raise N8nApiError(
-                        error_msg, 
-                        response.status_code, 
-                        error_data
+                    last_exception = error
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    log.warning(
+                        "Retryable HTTP error",
+                        attempt=attempt + 1,
+                        status_code=response.status_code
                     )
-                
-                # Başarılı yanıt
-                result = response.json()
-                
-                # Cache'e kaydet (sadece GET istekleri için)
-                if method.upper() == "GET" and use_cache:
-                    self._set_cache(cache_key, result)
-                
-                logger.info(
-                    "HTTP request successful", 
-                    method=method, 
-                    endpoint=endpoint,
-                    status_code=response.status_code
-                )
-                
-                return result
+                    
+                else:
+                    # Başarılı yanıt
+                    log.info("HTTP request successful", status_code=response.status_code)
+                    
+                    return response
                 
             except httpx.TimeoutException as e:
                 last_exception = N8nApiError(f"Request timeout: {str(e)}")
-                logger.warning("Request timeout", attempt=attempt + 1, endpoint=endpoint)
+                if not self._is_retryable_transport_error(e, method):
+                    raise last_exception from e
+                log.warning("Request timeout", attempt=attempt + 1)
                 
             except httpx.NetworkError as e:
                 last_exception = N8nApiError(f"Network error: {str(e)}")
-                logger.warning("Network error", attempt=attempt + 1, endpoint=endpoint)
+                if not self._is_retryable_transport_error(e, method):
+                    raise last_exception from e
+                log.warning("Network error", attempt=attempt + 1)
                 
             except N8nApiError:
-                # API hatalarını direkt fırlat, retry yapma
+                # Tekrar denenemeyen API hatalarını direkt fırlat
                 raise
                 
             except Exception as e:
-                last_exception = N8nApiError(f"Unexpected error: {str(e)}")
-                logger.error("Unexpected error", attempt=attempt + 1, error=str(e))
+                # Beklenmeyen hatalar geçici değildir, retry yapma
+                log.error("Unexpected error", attempt=attempt + 1, error=str(e))
+                raise N8nApiError(f"Unexpected error: {str(e)}") from e
             
             # Son deneme değilse bekle
             if attempt < self.max_retries:
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.info("Retrying request", wait_time=wait_time)
+                if retry_after is not None:
+                    wait_time = retry_after
+                else:
+                    # Decorrelated jitter: eşzamanlı retry'ların aynı anda patlamasını önler
+                    last_sleep = min(self._retry_cap, random.uniform(self._retry_base, last_sleep * 3))
+                    wait_time = last_sleep
+                log.info("Retrying request", wait_time=wait_time)
                 await asyncio.sleep(wait_time)
         
         # Tüm denemeler başarısız oldu
         raise last_exception or N8nApiError("Max retries exceeded")
     
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+        """Başarılı yanıtın JSON gövdesini çöz"""
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise N8nApiError(f"Invalid JSON response: {str(e)}", response.status_code) from e
+    
+    @staticmethod
+    def _api_error_from_response(response: httpx.Response) -> N8nApiError:
+        """Hatalı HTTP yanıtından N8nApiError oluştur"""
+        try:
+            error_data = orjson.loads(response.content) if response.content else {"message": response.text}
+        except orjson.JSONDecodeError:
+            error_data = {"message": response.text}
+        
+        error_msg = f"n8n API error: {response.status_code}"
+        if error_data and "message" in error_data:
+            error_msg += f" - {error_data['message']}"
+        
+        return N8nApiError(
+            error_msg, 
+            response.status_code, 
+            error_data
+        )
+    
+    async def _stream_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefix: str = "data.item"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        GET yanıtındaki JSON dizisini tüm gövdeyi belleğe almadan eleman eleman üret.
+        
+        Retry yapılmaz, tüm hatalar N8nApiError olarak fırlatılır; çağıran taraf
+        _make_request'e dönebilir. Erken bırakılacaksa contextlib.aclosing ile kullanılmalı.
+        """
+        try:
+            async with self.client.stream("GET", endpoint, params=params) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    raise self._api_error_from_response(response)
+                
+                items = ijson.sendable_list()
+                # Decimal yerine float: cache'lenen veri orjson ile yeniden serileştirilebilsin
+                parser = ijson.items_coro(items, prefix, use_float=True)
+                
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        yield item
+                    del items[:]
+                
+                parser.close()
+                for item in items:
+                    yield item
+                
+        except ijson.JSONError as e:
+            raise N8nApiError(f"Invalid JSON response: {str(e)}") from e
+        except httpx.TimeoutException as e:
+            raise N8nApiError(f"Request timeout: {str(e)}") from e
+        except httpx.NetworkError as e:
+            raise N8nApiError(f"Network error: {str(e)}") from e
+    
+    @staticmethod
+    def _is_retryable_status(status_code: int, method: str) -> bool:
+        """
+        HTTP durum kodunun tekrar denenebilir olup olmadığını kontrol et.
+        
+        5xx yanıtı sunucu isteği işledikten sonra da gelebilir; POST gibi
+        idempotent olmayan istekleri tekrarlamak işlemi iki kez yapabilir.
+        """
+        if status_code >= 500:
+            return method.upper() in _IDEMPOTENT_METHODS
+        return status_code in _RETRYABLE_STATUS_CODES
+    
+    @staticmethod
+    def _is_retryable_transport_error(error: httpx.TransportError, method: str) -> bool:
+        """
+        Transport hatasından sonra isteğin tekrar denenip denenemeyeceğini kontrol et.
+        
+        Okuma zaman aşımı gibi hatalarda istek sunucuya ulaşmış olabilir; idempotent
+        olmayan istekler sadece bağlantı kurulamadıysa tekrar denenir.
+        """
+        return method.upper() in _IDEMPOTENT_METHODS or isinstance(error, _UNSENT_REQUEST_ERRORS)
+    
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Retry-After header'ını (saniye) bekleme süresine çevir"""
+        if value is None:
+            return None
+        
+        try:
+            seconds = float(value)
+        except ValueError:
+            # HTTP-date formatı desteklenmiyor, jitter'a dön
+            return None
+        
+        # Çok uzun beklemeler tool çağrısını kilitlemesin
+        return min(self._retry_cap, max(0.0, seconds))
+    
     async def health_check(self) -> bool:
         """API sağlığını kontrol et"""
         try:
             await self._make_request("GET", "/workflows", params={"limit": 1})
-            logger.info("Health check passed")
+            self._log.info("Health check passed")
             return True
         except Exception as e:
-            logger.error("Health check failed", error=str(e))
+            self._log.error("Health check failed", error=str(e))
             return False
     
     # ======================== WORKFLOW CRUD OPERASYONLARI ========================
     
     async def create_workflow(self, workflow: WorkflowModel) -> WorkflowModel:
         """Yeni workflow oluştur"""
-        workflow_data = workflow.model_dump(exclude_unset=True, exclude_none=True)
+        workflow_data = workflow.fast_dump()
         
-        logger.info("Creating workflow", name=workflow.name)
+        self._log.info("Creating workflow", name=workflow.name)
         
         result = await self._make_request("POST", "/workflows", data=workflow_data)
         
-        # Cache'i temizle çünkü yeni workflow eklendi
-        self._clear_cache()
+        # Workflow listesi cache'ini temizle çünkü yeni workflow eklendi
+        self._invalidate_workflow()
         
-        logger.info("Workflow created successfully", id=result.get("id"), name=workflow.name)
+        self._log.info("Workflow created successfully", id=result.get("id"), name=workflow.name)
         
-        return WorkflowModel(**result)
+        return WorkflowModel.model_validate(result)
     
     async def get_workflow(self, workflow_id: str, use_cache: bool = True) -> Optional[WorkflowModel]:
         """Workflow ID'sine göre workflow getir"""
-        logger.info("Getting workflow", id=workflow_id)
+        self._log.info("Getting workflow", id=workflow_id)
         
         try:
             result = await self._make_request(
                 "GET", 
-                f"/workflows/{workflow_id}", 
+                _WF_PREFIX + workflow_id, 
                 use_cache=use_cache
             )
-            logger.info("Workflow retrieved successfully", id=workflow_id)
-            return WorkflowModel(**result)
+            self._log.info("Workflow retrieved successfully", id=workflow_id)
+            return WorkflowModel.model_validate(result)
             
         except N8nApiError as e:
             if e.status_code == 404:
-                logger.warning("Workflow not found", id=workflow_id)
+                self._log.warning("Workflow not found", id=workflow_id)
                 return None
             raise
     
+    async def get_workflows(self, workflow_ids: List[str], use_cache: bool = True) -> List[Optional[WorkflowModel]]:
+        """Birden fazla workflow'u sınırlı eşzamanlılıkla getir (bulunamayanlar için None)"""
+        self._log.info("Getting workflows", count=len(workflow_ids))
+        
+        async def fetch(workflow_id: str) -> Optional[WorkflowModel]:
+            async with self._semaphore:
+                return await self.get_workflow(workflow_id, use_cache=use_cache)
+        
+        return await asyncio.gather(*(fetch(workflow_id) for workflow_id in workflow_ids))
+    
     async def update_workflow(self, workflow_id: str, workflow: WorkflowModel) -> WorkflowModel:
         """Workflow'u güncelle"""
-        workflow_data = workflow.model_dump(exclude_unset=True, exclude_none=True)
+        workflow_data = workflow.fast_dump()
         
-        logger.info("Updating workflow", id=workflow_id, name=workflow.name)
+        self._log.info("Updating workflow", id=workflow_id, name=workflow.name)
         
         result = await self._make_request(
             "PUT", 
-            f"/workflows/{workflow_id}", 
+            _WF_PREFIX + workflow_id, 
             data=workflow_data
         )
         
-        # Cache'i temizle çünkü workflow güncellendi
-        self._clear_cache()
+        # İlgili cache girdilerini temizle çünkü workflow güncellendi
+        self._invalidate_workflow(workflow_id)
         
-        logger.info("Workflow updated successfully", id=workflow_id)
+        self._log.info("Workflow updated successfully", id=workflow_id)
         
-        return WorkflowModel(**result)
+        return WorkflowModel.model_validate(result)
     
     async def delete_workflow(self, workflow_id: str) -> bool:
         """Workflow'u sil"""
-        logger.info("Deleting workflow", id=workflow_id)
+        self._log.info("Deleting workflow", id=workflow_id)
         
         try:
-            await self._make_request("DELETE", f"/workflows/{workflow_id}")
+            await self._make_request("DELETE", _WF_PREFIX + workflow_id)
             
-            # Cache'i temizle çünkü workflow silindi
-            self._clear_cache()
+            # İlgili cache girdilerini temizle çünkü workflow silindi
+            self._invalidate_workflow(workflow_id)
             
-            logger.info("Workflow deleted successfully", id=workflow_id)
+            self._log.info("Workflow deleted successfully", id=workflow_id)
             return True
             
         except N8nApiError as e:
             if e.status_code == 404:
-                logger.warning("Workflow not found for deletion", id=workflow_id)
+                self._log.warning("Workflow not found for deletion", id=workflow_id)
                 return False
             raise
     
@@ -320,7 +754,7 @@ class N8nApiClient:
         if tags:
             params["tags"] = ",".join(tags)
         
-        logger.info("Listing workflows", params=params)
+        self._log.info("Listing workflows", params=params)
         
         result = await self._make_request(
             "GET", 
@@ -329,70 +763,155 @@ class N8nApiClient:
             use_cache=use_cache
         )
         
-        workflows = []
-        for workflow_data in result.get("data", []):
-            workflows.append(WorkflowModel(**workflow_data))
+        if result is self._index_source:
+            # Aynı (cache'lenmiş) yanıt zaten index'lendi, modelleri yeniden kurma
+            workflows = list(self._indexed_workflows)
+        else:
+            workflows = _WORKFLOW_LIST_ADAPTER.validate_python(result.get("data", []))
+            self._build_search_index(result, workflows)
         
-        logger.info("Workflows listed successfully", count=len(workflows))
+        self._log.info("Workflows listed successfully", count=len(workflows))
         
         return workflows
     
     async def search_workflows(self, query: str, limit: int = 20) -> List[WorkflowModel]:
         """Workflow'ları isme göre ara"""
-        logger.info("Searching workflows", query=query, limit=limit)
+        self._log.info("Searching workflows", query=query, limit=limit)
         
-        # n8n API'si doğrudan arama desteklemiyorsa, tüm workflow'ları getir ve filtrele
-        all_workflows = await self.list_workflows(limit=100)  # Daha büyük limit
+        query_lower = query.lower()
         
-        # Basit text matching (case-insensitive)
+        # Önce ad aramasını n8n'in belgelenmiş `name` filtresiyle yaptırmayı dene
+        if self._server_search_supported is not False:
+            try:
+                result = await self._make_request(
+                    "GET",
+                    "/workflows",
+                    params={"name": query, "limit": limit},
+                    use_cache=True
+                )
+            except N8nApiError as e:
+                if e.status_code != 400:
+                    raise
+                self._server_search_supported = False
+                self._log.info("Server-side search not supported, using local index")
+            else:
+                workflows = _WORKFLOW_LIST_ADAPTER.validate_python(result.get("data", []))
+                
+                if not all(query_lower in workflow.name.lower() for workflow in workflows):
+                    # Parametre yoksayılıp filtrelenmemiş liste döndü: desteklenmiyor say
+                    self._server_search_supported = False
+                    self._log.info("Server ignored the name filter, using local index")
+                else:
+                    # Boş yanıt desteği kanıtlamaz, kararı değiştirme
+                    if workflows:
+                        self._server_search_supported = True
+                    
+                    if len(workflows) >= limit:
+                        self._log.info("Workflow search completed", query=query, found=limit)
+                        return workflows[:limit]
+                    # Daha az sonuç: sadece tag'de geçen (veya tam ad eşleşmesi yapan
+                    # sürümlerde kaçan) workflow'lar için yerel aramaya devam et
+        
+        # n8n API'si doğrudan arama desteklemiyorsa yerel olarak filtrele
+        scan_key = ("GET", "/workflows", self._freeze_params({"limit": _SEARCH_SCAN_LIMIT}))
+        
+        if self._get_from_cache(scan_key) is not None:
+            # Liste cache'te: index üzerinden ara (index gerekirse yeniden kurulur)
+            await self.list_workflows(limit=_SEARCH_SCAN_LIMIT)
+            matched_workflows = self._search_index_lookup(query_lower, limit)
+        else:
+            try:
+                matched_workflows = await self._stream_search(scan_key, query_lower, limit)
+            except N8nApiError as e:
+                # Akış yolunda retry yok: geçici hatalarda listeyi retry'lı normal GET ile al
+                if e.status_code is not None and not self._is_retryable_status(e.status_code, "GET"):
+                    raise
+                self._log.warning("Streaming scan failed, falling back to a buffered request", error=e.message)
+                await self.list_workflows(limit=_SEARCH_SCAN_LIMIT)
+                matched_workflows = self._search_index_lookup(query_lower, limit)
+        
+        self._log.info("Workflow search completed", query=query, found=len(matched_workflows))
+        
+        return matched_workflows
+    
+    async def _stream_search(self, scan_key: CacheKey, query_lower: str, limit: int) -> List[WorkflowModel]:
+        """Listeyi akış halinde oku, yeterli eşleşme bulununca dur"""
         matched_workflows = []
-        query_lower = query.lower()
+        scanned = []
         
-        for workflow in all_workflows:
-            if (query_lower in workflow.name.lower() or 
-                any(query_lower in tag.get("name", "").lower() for tag in workflow.tags)):
+        async with aclosing(self._stream_get("/workflows", params={"limit": _SEARCH_SCAN_LIMIT})) as stream:
+            async for workflow_data in stream:
+                scanned.append(workflow_data)
+                workflow = WorkflowModel.model_validate(workflow_data)
+                
+                if self._matches_query(workflow, query_lower):
+                    matched_workflows.append(workflow)
+                    
+                    if len(matched_workflows) >= limit:
+                        break
+            else:
+                # Liste tamamen okundu: sonraki aramalar index'i kullanabilsin
+                self._set_cache(scan_key, "/workflows", {"data": scanned})
+        
+        return matched_workflows
+    
+    def _search_index_lookup(self, query_lower: str, limit: int) -> List[WorkflowModel]:
+        """Trigram index üzerinden eşleşen workflow'ları bul"""
+        grams = self._trigrams(query_lower)
+        if grams:
+            candidates = reduce(
+                set.intersection,
+                (self._search_index.get(gram, set()) for gram in grams)
+            )
+        else:
+            # 3 karakterden kısa sorgular için tüm workflow'lar aday
+            candidates = range(len(self._indexed_workflows))
+        
+        # Trigram eşleşmesi yeterli değil, aday kümede substring kontrolü yap
+        matched_workflows = []
+        for position in sorted(candidates):
+            workflow = self._indexed_workflows[position]
+            if self._matches_query(workflow, query_lower):
                 matched_workflows.append(workflow)
                 
                 if len(matched_workflows) >= limit:
                     break
         
-        logger.info("Workflow search completed", query=query, found=len(matched_workflows))
-        
         return matched_workflows
     
     async def activate_workflow(self, workflow_id: str) -> bool:
         """Workflow'u aktif et"""
-        logger.info("Activating workflow", id=workflow_id)
+        self._log.info("Activating workflow", id=workflow_id)
         
         try:
-            await self._make_request("POST", f"/workflows/{workflow_id}/activate")
-            self._clear_cache()
-            logger.info("Workflow activated successfully", id=workflow_id)
+            await self._make_request("POST", _WF_PREFIX + workflow_id + _ACTIVATE)
+            self._invalidate_workflow(workflow_id)
+            self._log.info("Workflow activated successfully", id=workflow_id)
             return True
         except N8nApiError as e:
             if e.status_code == 404:
-                logger.warning("Workflow not found for activation", id=workflow_id)
+                self._log.warning("Workflow not found for activation", id=workflow_id)
                 return False
             raise
     
     async def deactivate_workflow(self, workflow_id: str) -> bool:
         """Workflow'u pasif et"""
-        logger.info("Deactivating workflow", id=workflow_id)
+        self._log.info("Deactivating workflow", id=workflow_id)
         
         try:
-            await self._make_request("POST", f"/workflows/{workflow_id}/deactivate")
-            self._clear_cache()
-            logger.info("Workflow deactivated successfully", id=workflow_id)
+            await self._make_request("POST", _WF_PREFIX + workflow_id + _DEACTIVATE)
+            self._invalidate_workflow(workflow_id)
+            self._log.info("Workflow deactivated successfully", id=workflow_id)
             return True
         except N8nApiError as e:
             if e.status_code == 404:
-                logger.warning("Workflow not found for deactivation", id=workflow_id)
+                self._log.warning("Workflow not found for deactivation", id=workflow_id)
                 return False
             raise
     
     async def execute_workflow(self, workflow_id: str, input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Workflow'u manuel çalıştır"""
-        logger.info("Executing workflow", id=workflow_id)
+        self._log.info("Executing workflow", id=workflow_id)
         
         execution_data = {"workflowData": {"id": workflow_id}}
         if input_data:
@@ -400,6 +919,6 @@ class N8nApiClient:
         
         result = await self._make_request("POST", "/executions", data=execution_data)
         
-        logger.info("Workflow execution started", id=workflow_id, execution_id=result.get("id"))
+        self._log.info("Workflow execution started", id=workflow_id, execution_id=result.get("id"))
         
         return result
\ No newline at end of file
@@ -5,11 +5,11 @@ Uygulama ayarlarını güvenli bir şekilde yönetmek için konfigürasyon sın
 """
 
 import os
-import json
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, List
 from pathlib import Path
+import orjson
 from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
 
 
 class N8nConfig(BaseModel):
@@ -59,22 +59,37 @@ class PerformanceConfig(BaseModel):
     response_timeout: int = Field(2, description="Response timeout target in seconds")
 
 
-class Settings(BaseSettings):
+@dataclass(slots=True)
+class Settings:
     """Ana konfigürasyon sınıfı"""
     
     # Alt konfigürasyonlar
     n8n: N8nConfig
-    mcp: McpConfig = Field(default_factory=McpConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-    security: SecurityConfig = Field(default_factory=SecurityConfig)
-    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    mcp: McpConfig = field(default_factory=McpConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    security: SecurityConfig = field(default_factory=SecurityConfig)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
     
-    model_config = {
-        "env_file": ".env",
-        "env_nested_delimiter": "__",
-        "case_sensitive": False,
-        "extra": "ignore"  # Extra alanları yoksay
-    }
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> "Settings":
+        """
+        Sözlükten ayarları oluştur (bilinmeyen anahtarlar yoksayılır).
+        
+        SECTION__FIELD biçimindeki ortam değişkenleri sözlükte olmayan alanları doldurur;
+        sözlükteki değerler önceliklidir.
+        """
+        config_data = _deep_merge(_nested_env_values(), config_data)
+        return cls(
+            n8n=N8nConfig.model_validate(config_data.get("n8n")),
+            mcp=McpConfig.model_validate(config_data.get("mcp", {})),
+            logging=LoggingConfig.model_validate(config_data.get("logging", {})),
+            security=SecurityConfig.model_validate(config_data.get("security", {})),
+            performance=PerformanceConfig.model_validate(config_data.get("performance", {}))
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Ayarları sözlüğe çevir"""
+        return {f.name: getattr(self, f.name).model_dump() for f in fields(self)}
     
     @classmethod
     def load_from_file(cls, config_path: Optional[str] = None) -> "Settings":
@@ -82,42 +97,44 @@ class Settings(BaseSettings):
         if config_path is None:
             # Varsayılan konfigürasyon dosyası yolları
             possible_paths = [
-                "config/config.json",
-                "config.json",
-                os.path.expanduser("~/.n8n-mcp/config.json"),
-                "/etc/n8n-mcp/config.json"
+                Path("config/config.json"),
+                Path("config.json"),
+                Path("~/.n8n-mcp/config.json").expanduser(),
+                Path("/etc/n8n-mcp/config.json")
             ]
             
-            config_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    config_path = path
-                    break
+            path = next((p for p in possible_paths if p.is_file()), None)
             
-            if config_path is None:
+            if path is None:
                 raise FileNotFoundError(
-                    f"Config file not found in any of these locations: {possible_paths}"
+                    f"Config file not found in any of these locations: {[str(p) for p in possible_paths]}"
                 )
+        else:
+            path = Path(config_path)
+            
+            if not path.is_file():
+                raise FileNotFoundError(f"Config file not found: {config_path}")
         
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        config_data = orjson.loads(path.read_bytes())
         
-        return cls(**config_data)
+        return cls.from_dict(config_data)
     
     @classmethod
     def load_from_env(cls) -> "Settings":
         """Ortam değişkenlerinden ayarları yükle"""
         
-        # .env dosyasından değişkenleri yükle
-        from dotenv import load_dotenv
-        load_dotenv()
+        # .env dosyasını bu modülün dizininden yukarı doğru ara; böylece sunucu başka bir
+        # çalışma dizininden başlatılsa da proje kökündeki .env bulunur (dotenv sadece burada gerekir)
+        from dotenv import find_dotenv, load_dotenv
+        dotenv_path = find_dotenv()
+        if dotenv_path:
+            load_dotenv(dotenv_path)
+        
+        env = os.environ
         
         # Gerekli ortam değişkenlerini kontrol et
-        n8n_base_url = os.getenv("N8N_BASE_URL", "").strip()
-        n8n_api_key = os.getenv("N8N_API_KEY", "").strip()
+        n8n_base_url = env.get("N8N_BASE_URL", "").strip()
+        n8n_api_key = env.get("N8N_API_KEY", "").strip()
         
         if not n8n_base_url:
             raise ValueError("N8N_BASE_URL environment variable is required")
@@ -129,31 +146,31 @@ class Settings(BaseSettings):
             "n8n": {
                 "base_url": n8n_base_url,
                 "api_key": n8n_api_key,
-                "timeout": int(os.getenv("N8N_TIMEOUT", "30")),
-                "max_retries": int(os.getenv("N8N_MAX_RETRIES", "3"))
+                "timeout": int(env.get("N8N_TIMEOUT", "30")),
+                "max_retries": int(env.get("N8N_MAX_RETRIES", "3"))
             }
         }
         
         # MCP ayarları
-        if os.getenv("MCP_SERVER_NAME"):
+        if env.get("MCP_SERVER_NAME"):
             config_data["mcp"] = {
-                "server_name": os.getenv("MCP_SERVER_NAME"),
-                "version": os.getenv("MCP_VERSION", "1.0.0"),
-                "description": os.getenv("MCP_DESCRIPTION", "MCP server for managing n8n workflows"),
-                "port": int(os.getenv("MCP_PORT", "8080"))
+                "server_name": env["MCP_SERVER_NAME"],
+                "version": env.get("MCP_VERSION", "1.0.0"),
+                "description": env.get("MCP_DESCRIPTION", "MCP server for managing n8n workflows"),
+                "port": int(env.get("MCP_PORT", "8080"))
             }
         
         # Logging ayarları
-        if os.getenv("LOG_LEVEL"):
+        if env.get("LOG_LEVEL"):
             config_data["logging"] = {
-                "level": os.getenv("LOG_LEVEL"),
-                "format": os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-                "file": os.getenv("LOG_FILE"),
-                "max_bytes": int(os.getenv("LOG_MAX_BYTES", "10485760")),
-                "backup_count": int(os.getenv("LOG_BACKUP_COUNT", "5"))
+                "level": env["LOG_LEVEL"],
+                "format": env.get("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+                "file": env.get("LOG_FILE"),
+                "max_bytes": int(env.get("LOG_MAX_BYTES", "10485760")),
+                "backup_count": int(env.get("LOG_BACKUP_COUNT", "5"))
             }
         
-        return cls(**config_data)
+        return cls.from_dict(config_data)
     
     def save_to_file(self, config_path: str):
         """Konfigürasyonu dosyaya kaydet"""
@@ -163,10 +180,10 @@ class Settings(BaseSettings):
             os.makedirs(config_dir, exist_ok=True)
         
         # Konfigürasyonu JSON olarak kaydet
-        config_dict = self.model_dump()
+        config_dict = self.to_dict()
         
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        with open(config_path, 'wb') as f:
+            f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
     
     def validate_n8n_connection(self) -> bool:
         """n8n konfigürasyonunun geçerli olup olmadığını kontrol et"""
@@ -193,6 +210,60 @@ class Settings(BaseSettings):
         return None
 
 
+# İç içe ayarlar için ortam değişkeni ayracı (örn. PERFORMANCE__CACHE_TTL)
+_ENV_NESTED_DELIMITER = "__"
+
+
+def _decode_env_value(model: type, path: List[str], value: str) -> Any:
+    """
+    Ortam değişkeni değerini hedef alanın tipine göre çöz.
+    
+    String alanlar olduğu gibi kalır; diğerleri (bool, sayı, sözlük içi değerler)
+    JSON olarak çözülür, örn. "false" -> False. JSON değilse ham string döner.
+    """
+    field_info = model.model_fields.get(path[0])
+    if field_info is None or field_info.annotation in (str, Optional[str]):
+        return value
+    
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return value
+
+
+def _nested_env_values() -> Dict[str, Any]:
+    """SECTION__FIELD biçimindeki ortam değişkenlerini iç içe sözlüğe çevir (büyük/küçük harf duyarsız)"""
+    section_models = {f.name: f.type for f in fields(Settings)}
+    values: Dict[str, Any] = {}
+    
+    for name, value in os.environ.items():
+        section, *path = name.lower().split(_ENV_NESTED_DELIMITER)
+        if section not in section_models or not path or not all(path):
+            continue
+        
+        value = _decode_env_value(section_models[section], path, value)
+        target = values.setdefault(section, {})
+        for part in path[:-1]:
+            target = target.setdefault(part, {})
+            if not isinstance(target, dict):
+                break
+        else:
+            target[path[-1]] = value
+    
+    return values
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """İki sözlüğü iç içe birleştir; çakışmalarda override kazanır"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 def load_settings(config_path: Optional[str] = None, use_env: bool = False) -> Settings:
     """
     Konfigürasyonu yükle
@@ -250,8 +321,8 @@ def create_example_config(output_path: str = "config/config.example.json"):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     # Dosyayı kaydet
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(example_config, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(example_config, option=orjson.OPT_INDENT_2))
     
     print(f"Example config created at: {output_path}")
 
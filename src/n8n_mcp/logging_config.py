@@ -6,15 +6,38 @@ Structured logging kurulumu ve konfigürasyonu.
 
 import os
 import sys
+import atexit
+import queue
 import logging
 import logging.handlers
 from typing import Optional
+import orjson
 import structlog
 from pathlib import Path
 
 from .config import LoggingConfig
 
 
+# Handler'lara yazan arka plan dinleyicisi (setup_logging tarafından başlatılır)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener():
+    """Kuyruktaki kayıtları boşalt ve dinleyiciyi durdur"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _orjson_dumps(obj, default=None) -> str:
+    """structlog JSONRenderer için orjson tabanlı serializer"""
+    return orjson.dumps(obj, default=default).decode()
+
+
 def setup_logging(config: LoggingConfig):
     """
     Structured logging'i ayarla
@@ -22,8 +45,8 @@ def setup_logging(config: LoggingConfig):
     Args:
         config: Logging konfigürasyonu
     """
-    # Log level'ı ayarla
-    log_level = getattr(logging, config.level.upper(), logging.INFO)
+    # Log level'ı ayarla (handler'lar NOTSET kalır, seviyeyi root logger'dan alır)
+    log_level = logging.getLevelNamesMapping().get(config.level.upper(), logging.INFO)
     
     # Root logger'ı konfigüre et
     logging.basicConfig(
@@ -37,7 +60,6 @@ def setup_logging(config: LoggingConfig):
     
     # Console handler (her zaman ekle)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
     console_formatter = logging.Formatter(config.format)
     console_handler.setFormatter(console_formatter)
     handlers.append(console_handler)
@@ -57,36 +79,46 @@ def setup_logging(config: LoggingConfig):
             encoding='utf-8'
         )
         
-        file_handler.setLevel(log_level)
         file_formatter = logging.Formatter(config.format)
         file_handler.setFormatter(file_formatter)
         handlers.append(file_handler)
     
-    # Root logger'a handlers'ları ekle
+    # Root logger'a sadece QueueHandler ekle; dosya/konsol yazımı arka plan
+    # thread'inde yapılır, böylece event loop log I/O'su ile bloklanmaz
+    global _queue_listener
+    _stop_queue_listener()
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    
     root_logger = logging.getLogger()
     root_logger.handlers.clear()  # Mevcut handlers'ları temizle
-    
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Structlog'u konfigüre et
     structlog.configure(
         processors=[
             # Built-in processors
             structlog.stdlib.filter_by_level,
+            structlog.contextvars.merge_contextvars,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.TimeStamper(fmt="ISO"),
-            structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             
             # JSON formatter for structured logging
-            structlog.processors.JSONRenderer() if config.file else structlog.dev.ConsoleRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps) if config.file else structlog.dev.ConsoleRenderer()
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Seviye altındaki log çağrıları processor zincirine girmeden elenir
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
     
@@ -6,24 +6,36 @@ standardını kullananan ana sunucu sınıfı.
 """
 
 import asyncio
+import functools
 import os
-import json
 import sys
 import logging
-from typing import Optional
+from typing import Any, Optional
+import orjson
 import structlog
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from mcp.server import Server, NotificationOptions
 from mcp.server.stdio import stdio_server
 from mcp import types
 
-from .client import N8nApiClient
+from .client import N8nApiClient, WorkflowModel
 from .config import Settings, load_settings
 from .logging_config import setup_logging
 
 
 logger = structlog.get_logger(__name__)
 
+# health_check yanıt mesajları
+_HEALTHY_MESSAGE = "n8n API is accessible"
+_UNHEALTHY_MESSAGE = "n8n API is not accessible"
 
+# update_workflow ile güncellenebilen alanlar ve PUT gövdesi için zorunlu olanlar
+_UPDATE_FIELDS = ("name", "nodes", "connections", "active", "tags")
+_UPDATE_REQUIRED_FIELDS = ("name", "nodes", "connections")
+
+
+# Tool tanımları statik; ilk çağrıda bir kez oluşturulur ve aynı liste paylaşılır
+@functools.lru_cache(maxsize=1)
 def get_tool_definitions() -> list[types.Tool]:
     """Returns the static list of n8n tool definitions."""
     return [
@@ -231,19 +243,108 @@ def get_tool_definitions() -> list[types.Tool]:
     ]
 
 
+class _ToolArgs(BaseModel):
+    """Tool argüman modellerinin ortak tabanı"""
+    model_config = ConfigDict(extra="ignore")
+
+
+class _WorkflowIdArgs(_ToolArgs):
+    workflow_id: str
+
+
+class _CreateWorkflowArgs(_ToolArgs):
+    name: str
+    nodes: list[dict[str, Any]] = Field(default_factory=list)
+    connections: dict[str, Any] = Field(default_factory=dict)
+    active: bool = False
+    tags: list[dict[str, Any]] = Field(default_factory=list)
+
+
+class _GetWorkflowArgs(_WorkflowIdArgs):
+    use_cache: bool = True
+
+
+class _ListWorkflowsArgs(_ToolArgs):
+    active: Optional[bool] = None
+    tags: Optional[list[str]] = None
+    limit: int = 20
+
+
+class _SearchWorkflowsArgs(_ToolArgs):
+    query: str
+    limit: int = 20
+
+
+class _UpdateWorkflowArgs(_WorkflowIdArgs):
+    name: Optional[str] = None
+    nodes: Optional[list[dict[str, Any]]] = None
+    connections: Optional[dict[str, Any]] = None
+    active: Optional[bool] = None
+    tags: Optional[list[dict[str, Any]]] = None
+
+
+def _err(message: str) -> list[types.TextContent]:
+    """Tek metinlik hata yanıtı oluştur"""
+    return [types.TextContent(type="text", text=message)]
+
+
+class _FrozenTextContent(types.TextContent):
+    """Paylaşılan hazır yanıtlarda kullanılan değiştirilemez TextContent"""
+    model_config = ConfigDict(frozen=True)
+
+
+# Sık görülen eksik alan hataları için hazır içerikler (her seferinde model kurulmasın);
+# içerik donmuş, her çağrıya yeni bir liste verilir
+_MISSING_FIELD_CONTENTS = {
+    field: _FrozenTextContent(type="text", text=f"Missing required field: {field}")
+    for field in ("name", "workflow_id", "query")
+}
+
+
+def _json_escape(value: str) -> str:
+    """Sabit şablonlu JSON yanıtlarına gömülecek string'i tırnaksız olarak kaçışla"""
+    return orjson.dumps(value).decode()[1:-1]
+
+
+def _validation_error_response(error: ValidationError) -> list[types.TextContent]:
+    """İlk doğrulama hatasını kullanıcıya dönülecek yanıta çevir"""
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first["loc"])
+    if first["type"] == "missing":
+        content = _MISSING_FIELD_CONTENTS.get(field)
+        return [content] if content is not None else _err(f"Missing required field: {field}")
+    return _err(f"Invalid value for field {field}: {first['msg']}")
+
+
+def _validated(model: type[_ToolArgs]):
+    """Handler argümanlarını model ile bir kez doğrulayıp handler'a model örneği geçir"""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(self, args: dict) -> list[types.TextContent]:
+            try:
+                parsed = model.model_validate(args)
+            except ValidationError as e:
+                return _validation_error_response(e)
+            return await handler(self, parsed)
+        return wrapper
+    return decorator
+
+
 class N8nMcpServer:
     """n8n MCP Server ana sınıfı"""
     
+    __slots__ = ("settings", "n8n_client", "server", "_log", "_endpoint")
+    
     def __init__(self, settings: Settings):
         self.settings = settings
         self.n8n_client: Optional[N8nApiClient] = None
+        # Client hazır olunca initialize() içinde n8n base URL'i ile değiştirilir
+        self._endpoint = "Unknown"
         self.server = Server(self.settings.mcp.server_name)
+        # Sunucu adını her log çağrısında tekrar geçmemek için bir kez bağla
+        self._log = logger.bind(server_name=self.settings.mcp.server_name)
         
-        logger.info(
-            "n8n MCP Server initialized", 
-            server_name=self.settings.mcp.server_name,
-            version=self.settings.mcp.version
-        )
+        self._log.info("n8n MCP Server initialized", version=self.settings.mcp.version)
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -256,7 +357,7 @@ class N8nMcpServer:
     
     async def initialize(self):
         """Sunucuyu başlat"""
-        logger.info("Initializing n8n MCP Server...")
+        self._log.info("Initializing n8n MCP Server...")
         
         # n8n API client'ı başlat
         self.n8n_client = N8nApiClient(
@@ -264,96 +365,95 @@ class N8nMcpServer:
             api_key=self.settings.n8n.api_key,
             timeout=self.settings.n8n.timeout,
             max_retries=self.settings.n8n.max_retries,
-            cache_ttl=self.settings.performance.cache_ttl
+            cache_ttl=self.settings.performance.cache_ttl,
+            max_concurrent_requests=self.settings.performance.max_concurrent_requests
         )
+        self._endpoint = self.n8n_client.base_url
         
-        # MCP handlers'ları kaydet
-        await self._register_handlers()
+        # Handler kaydı ile sağlık kontrolü birbirinden bağımsız, eşzamanlı çalıştır
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._register_handlers())
+            tg.create_task(self._safe_health_check())
         
-        # Sağlık kontrolü yap
+        self._log.info("n8n MCP Server initialization completed")
+    
+    async def _safe_health_check(self):
+        """Sağlık kontrolü yap; hata başlatmayı durdurmaz"""
         try:
             is_healthy = await self.n8n_client.health_check()
             if not is_healthy:
-                logger.warning("n8n API health check failed, but continuing...")
+                self._log.warning("n8n API health check failed, but continuing...")
             else:
-                logger.info("n8n API connection verified")
+                self._log.info("n8n API connection verified")
         except Exception as e:
-            logger.warning("n8n API health check error", error=str(e))
-        
-        logger.info("n8n MCP Server initialization completed")
+            self._log.warning("n8n API health check error", error=str(e))
     
     async def cleanup(self):
         """Temizleme işlemleri"""
-        logger.info("Cleaning up n8n MCP Server...")
+        self._log.info("Cleaning up n8n MCP Server...")
         
         if self.n8n_client:
             await self.n8n_client.close()
         
-        logger.info("n8n MCP Server cleanup completed")
+        self._log.info("n8n MCP Server cleanup completed")
     
-    def _get_tool_handlers(self):
-        """Returns a mapping of tool names to their handler methods."""
-        return {
-            "create_workflow": self._handle_create_workflow,
-            "get_workflow": self._handle_get_workflow,
-            "list_workflows": self._handle_list_workflows,
-            "search_workflows": self._handle_search_workflows,
-            "update_workflow": self._handle_update_workflow,
-            "delete_workflow": self._handle_delete_workflow,
-            "activate_workflow": self._handle_activate_workflow,
-            "deactivate_workflow": self._handle_deactivate_workflow,
-            "health_check": self._handle_health_check,
-        }
-
     async def _register_handlers(self):
         """MCP handler'ları kaydet"""
-        logger.info("Registering MCP handlers...")
-        
-        @self.server.list_tools()
-        async def list_tools() -> list[types.Tool]:
-            """Mevcut tool'ları listele"""
-            logger.debug("Listing available tools")
-            return get_tool_definitions()
+        self._log.info("Registering MCP handlers...")
         
-        @self.server.call_tool()
-        async def call_tool(name: str, arguments: dict | None) -> list[types.TextContent]:
-            """Tool çağrılarını işle"""
-            logger.info(f"Tool called: {name}", arguments=arguments)
+        self.server.list_tools()(self._list_tools)
+        self.server.call_tool()(self._call_tool)
+    
+    async def _list_tools(self) -> list[types.Tool]:
+        """Mevcut tool'ları listele"""
+        self._log.debug("Listing available tools")
+        return get_tool_definitions()
+    
+    async def _call_tool(self, name: str, arguments: dict | None) -> list[types.TextContent]:
+        """Tool çağrılarını işle"""
+        with structlog.contextvars.bound_contextvars(tool_name=name):
+            self._log.debug("tool_called", arguments=arguments)
+            
+            args = arguments or {}
             
-            handlers = self._get_tool_handlers()
-            handler = handlers.get(name)
-
             try:
-                if handler:
-                    return await handler(arguments or {})
-                else:
-                    logger.warning(f"Unknown tool called: {name}")
-                    return [types.TextContent(
-                        type="text",
-                        text=f"Unknown tool: {name}"
-                    )]
+                match name:
+                    case "create_workflow":
+                        return await self._handle_create_workflow(args)
+                    case "get_workflow":
+                        return await self._handle_get_workflow(args)
+                    case "list_workflows":
+                        return await self._handle_list_workflows(args)
+                    case "search_workflows":
+                        return await self._handle_search_workflows(args)
+                    case "update_workflow":
+                        return await self._handle_update_workflow(args)
+                    case "delete_workflow":
+                        return await self._handle_delete_workflow(args)
+                    case "activate_workflow":
+                        return await self._handle_activate_workflow(args)
+                    case "deactivate_workflow":
+                        return await self._handle_deactivate_workflow(args)
+                    case "health_check":
+                        return await self._handle_health_check(args)
+                    case _:
+                        self._log.warning("Unknown tool called")
+                        return _err(f"Unknown tool: {name}")
             except Exception as e:
-                logger.error("Tool execution error", tool_name=name, error=str(e))
-                return [types.TextContent(
-                    type="text",
-                    text=f"Tool execution error: {str(e)}"
-                )]
+                self._log.error("Tool execution error", error=str(e))
+                return _err(f"Tool execution error: {str(e)}")
     
     # Tool Handler Methods
-    async def _handle_create_workflow(self, args: dict) -> list[types.TextContent]:
+    @_validated(_CreateWorkflowArgs)
+    async def _handle_create_workflow(self, args: _CreateWorkflowArgs) -> list[types.TextContent]:
         """Workflow oluşturma handler'ı"""
-        if "name" not in args:
-            return [types.TextContent(type="text", text="Missing required field: name")]
-        
         try:
-            from .client import WorkflowModel
-            
             workflow = WorkflowModel(
-                name=args["name"],
-                nodes=args.get("nodes", []),
-                connections=args.get("connections", {}),
-                active=args.get("active", False),
-                tags=args.get("tags", [])
+                name=args.name,
+                nodes=args.nodes,
+                connections=args.connections,
+                active=args.active,
+                tags=args.tags
             )
             
             created_workflow = await self.n8n_client.create_workflow(workflow)
@@ -369,52 +469,42 @@ class N8nMcpServer:
                 }
             }
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error creating workflow: {str(e)}")]
+            return _err(f"Error creating workflow: {str(e)}")
     
-    async def _handle_get_workflow(self, args: dict) -> list[types.TextContent]:
-        if "workflow_id" not in args:
-            return [types.TextContent(type="text", text="Missing required field: workflow_id")]
-        
+    @_validated(_GetWorkflowArgs)
+    async def _handle_get_workflow(self, args: _GetWorkflowArgs) -> list[types.TextContent]:
         try:
             workflow = await self.n8n_client.get_workflow(
-                args["workflow_id"], 
-                use_cache=args.get("use_cache", True)
+                args.workflow_id, 
+                use_cache=args.use_cache
             )
             
             if workflow is None:
-                return [types.TextContent(type="text", text=f"Workflow not found: {args['workflow_id']}")]
+                return _err(f"Workflow not found: {args.workflow_id}")
             
-            result = {
-                "success": True,
-                "workflow": workflow.model_dump(mode="json")
-            }
+            # Workflow'u pydantic-core ile doğrudan JSON'a çevir, ara dict oluşturma
+            text = '{"success":true,"workflow":' + workflow.model_dump_json() + '}'
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=text)]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error getting workflow: {str(e)}")]
+            return _err(f"Error getting workflow: {str(e)}")
     
-    async def _handle_list_workflows(self, args: dict) -> list[types.TextContent]:
+    @_validated(_ListWorkflowsArgs)
+    async def _handle_list_workflows(self, args: _ListWorkflowsArgs) -> list[types.TextContent]:
         """Workflow listeleme handler'ı"""
         try:
             workflows = await self.n8n_client.list_workflows(
-                active=args.get("active"),
-                tags=args.get("tags"),
-                limit=args.get("limit", 20),
+                active=args.active,
+                tags=args.tags,
+                limit=args.limit,
                 use_cache=True
             )
             
-            workflow_list = []
-            for workflow in workflows:
-                workflow_list.append({
-                    "id": workflow.id,
-                    "name": workflow.name,
-                    "active": workflow.active,
-                    "nodes_count": len(workflow.nodes)
-                })
+            workflow_list = [workflow.summary for workflow in workflows]
             
             result = {
                 "success": True,
@@ -422,68 +512,64 @@ class N8nMcpServer:
                 "workflows": workflow_list
             }
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error listing workflows: {str(e)}")]
+            return _err(f"Error listing workflows: {str(e)}")
     
-    async def _handle_search_workflows(self, args: dict) -> list[types.TextContent]:
+    @_validated(_SearchWorkflowsArgs)
+    async def _handle_search_workflows(self, args: _SearchWorkflowsArgs) -> list[types.TextContent]:
         """Workflow arama handler'ı"""
-        if "query" not in args:
-            return [types.TextContent(type="text", text="Missing required field: query")]
-        
         try:
             workflows = await self.n8n_client.search_workflows(
-                query=args["query"],
-                limit=args.get("limit", 20)
+                query=args.query,
+                limit=args.limit
             )
             
-            workflow_list = []
-            for workflow in workflows:
-                workflow_list.append({
-                    "id": workflow.id,
-                    "name": workflow.name,
-                    "active": workflow.active,
-                    "nodes_count": len(workflow.nodes)
-                })
+            workflow_list = [workflow.summary for workflow in workflows]
             
             result = {
                 "success": True,
-                "query": args["query"],
+                "query": args.query,
                 "found": len(workflow_list),
                 "workflows": workflow_list
             }
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error searching workflows: {str(e)}")]
+            return _err(f"Error searching workflows: {str(e)}")
     
-    async def _handle_update_workflow(self, args: dict) -> list[types.TextContent]:
+    @_validated(_UpdateWorkflowArgs)
+    async def _handle_update_workflow(self, args: _UpdateWorkflowArgs) -> list[types.TextContent]:
         """Workflow güncelleme handler'ı"""
-        if "workflow_id" not in args:
-            return [types.TextContent(type="text", text="Missing required field: workflow_id")]
-        
         try:
-            # Önce mevcut workflow'u getir
-            existing_workflow = await self.n8n_client.get_workflow(args["workflow_id"])
-            
-            if existing_workflow is None:
-                return [types.TextContent(type="text", text=f"Workflow not found: {args['workflow_id']}")]
+            # n8n public API'si PATCH desteklemiyor, PUT tam gövde istiyor.
+            # Zorunlu alanların hepsi verildiyse mevcut workflow'u getirmeye gerek yok
+            # Yalnızca çağıranın gönderdiği alanlar
+            supplied = args.model_dump(include=set(_UPDATE_FIELDS), exclude_unset=True)
             
-            # Güncelleme verilerini hazırla - sadece sağlanan alanları güncelle
-            from .client import WorkflowModel
-            
-            update_data = {
-                "name": args.get("name", existing_workflow.name),
-                "nodes": args.get("nodes", existing_workflow.nodes),
-                "connections": args.get("connections", existing_workflow.connections),
-                "active": args.get("active", existing_workflow.active),
-                "tags": args.get("tags", existing_workflow.tags)
-            }
+            if all(field in supplied for field in _UPDATE_REQUIRED_FIELDS):
+                update_data = supplied
+            else:
+                # Önce mevcut workflow'u getir
+                existing_workflow = await self.n8n_client.get_workflow(args.workflow_id)
+                
+                if existing_workflow is None:
+                    return _err(f"Workflow not found: {args.workflow_id}")
+                
+                # Güncelleme verilerini hazırla - sadece sağlanan alanları güncelle
+                update_data = {
+                    "name": existing_workflow.name,
+                    "nodes": existing_workflow.nodes,
+                    "connections": existing_workflow.connections,
+                    "active": existing_workflow.active,
+                    "tags": existing_workflow.tags,
+                    **supplied
+                }
             
             workflow = WorkflowModel(**update_data)
-            updated_workflow = await self.n8n_client.update_workflow(args["workflow_id"], workflow)
+            updated_workflow = await self.n8n_client.update_workflow(args.workflow_id, workflow)
             
             result = {
                 "success": True,
@@ -496,78 +582,61 @@ class N8nMcpServer:
                 }
             }
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error updating workflow: {str(e)}")]
+            return _err(f"Error updating workflow: {str(e)}")
     
-    async def _handle_delete_workflow(self, args: dict) -> list[types.TextContent]:
+    @_validated(_WorkflowIdArgs)
+    async def _handle_delete_workflow(self, args: _WorkflowIdArgs) -> list[types.TextContent]:
         """Workflow silme handler'ı"""
-        if "workflow_id" not in args:
-            return [types.TextContent(type="text", text="Missing required field: workflow_id")]
-        
         try:
-            deleted = await self.n8n_client.delete_workflow(args["workflow_id"])
+            deleted = await self.n8n_client.delete_workflow(args.workflow_id)
             
             if not deleted:
-                return [types.TextContent(type="text", text=f"Workflow not found: {args['workflow_id']}")]
+                return _err(f"Workflow not found: {args.workflow_id}")
             
-            result = {
-                "success": True,
-                "message": f"Workflow '{args['workflow_id']}' deleted successfully",
-                "workflow_id": args["workflow_id"]
-            }
+            wid = _json_escape(args.workflow_id)
+            text = f'{{"success":true,"message":"Workflow \'{wid}\' deleted successfully","workflow_id":"{wid}"}}'
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=text)]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error deleting workflow: {str(e)}")]
+            return _err(f"Error deleting workflow: {str(e)}")
     
-    async def _handle_activate_workflow(self, args: dict) -> list[types.TextContent]:
+    @_validated(_WorkflowIdArgs)
+    async def _handle_activate_workflow(self, args: _WorkflowIdArgs) -> list[types.TextContent]:
         """Workflow aktivasyon handler'ı"""
-        if "workflow_id" not in args:
-            return [types.TextContent(type="text", text="Missing required field: workflow_id")]
-        
         try:
-            activated = await self.n8n_client.activate_workflow(args["workflow_id"])
+            activated = await self.n8n_client.activate_workflow(args.workflow_id)
             
             if not activated:
-                return [types.TextContent(type="text", text=f"Workflow not found: {args['workflow_id']}")]
+                return _err(f"Workflow not found: {args.workflow_id}")
             
-            result = {
-                "success": True,
-                "message": f"Workflow '{args['workflow_id']}' activated successfully",
-                "workflow_id": args["workflow_id"],
-                "active": True
-            }
+            wid = _json_escape(args.workflow_id)
+            text = f'{{"success":true,"message":"Workflow \'{wid}\' activated successfully","workflow_id":"{wid}","active":true}}'
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=text)]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error activating workflow: {str(e)}")]
+            return _err(f"Error activating workflow: {str(e)}")
     
-    async def _handle_deactivate_workflow(self, args: dict) -> list[types.TextContent]:
+    @_validated(_WorkflowIdArgs)
+    async def _handle_deactivate_workflow(self, args: _WorkflowIdArgs) -> list[types.TextContent]:
         """Workflow deaktivasyon handler'ı"""
-        if "workflow_id" not in args:
-            return [types.TextContent(type="text", text="Missing required field: workflow_id")]
-        
         try:
-            deactivated = await self.n8n_client.deactivate_workflow(args["workflow_id"])
+            deactivated = await self.n8n_client.deactivate_workflow(args.workflow_id)
             
             if not deactivated:
-                return [types.TextContent(type="text", text=f"Workflow not found: {args['workflow_id']}")]
+                return _err(f"Workflow not found: {args.workflow_id}")
             
-            result = {
-                "success": True,
-                "message": f"Workflow '{args['workflow_id']}' deactivated successfully",
-                "workflow_id": args["workflow_id"],
-                "active": False
-            }
+            wid = _json_escape(args.workflow_id)
+            text = f'{{"success":true,"message":"Workflow \'{wid}\' deactivated successfully","workflow_id":"{wid}","active":false}}'
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=text)]
             
         except Exception as e:
-            return [types.TextContent(type="text", text=f"Error deactivating workflow: {str(e)}")]
+            return _err(f"Error deactivating workflow: {str(e)}")
     
     async def _handle_health_check(self, args: dict) -> list[types.TextContent]:
         """Health check handler'ı"""
@@ -577,21 +646,21 @@ class N8nMcpServer:
             result = {
                 "success": True,
                 "healthy": is_healthy,
-                "message": "n8n API is accessible" if is_healthy else "n8n API is not accessible",
-                "endpoint": self.n8n_client.base_url
+                "message": _HEALTHY_MESSAGE if is_healthy else _UNHEALTHY_MESSAGE,
+                "endpoint": self._endpoint
             }
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
             
         except Exception as e:
             result = {
                 "success": False,
                 "healthy": False,
                 "error": str(e),
-                "endpoint": self.n8n_client.base_url if self.n8n_client else "Unknown"
+                "endpoint": self._endpoint
             }
             
-            return [types.TextContent(type="text", text=json.dumps(result))]
+            return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
 
 
 async def main():
@@ -646,5 +715,16 @@ async def main():
         sys.exit(1)
 
 
+def run():
+    """Sunucuyu mümkünse uvloop event loop'u ile çalıştır"""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop Windows'ta desteklenmiyor, standart event loop'a dön
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -1,21 +1,33 @@
 
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from src.n8n_mcp.client import N8nApiClient, WorkflowModel
 
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Replace asyncio.sleep suite-wide so retry backoff never stalls a test."""
+    sleep = AsyncMock(return_value=None)
+    monkeypatch.setattr("asyncio.sleep", sleep)
+    return sleep
+
 @pytest.fixture
 def mock_settings():
     """Fixture for mock settings."""
-    settings = MagicMock()
-    settings.n8n.base_url = "https://test.app.n8n.cloud"
-    settings.n8n.api_key = "test-api-key"
-    settings.n8n.timeout = 30
-    settings.n8n.max_retries = 3
-    settings.performance.cache_ttl = 300
-    return settings
+    return SimpleNamespace(
+        n8n=SimpleNamespace(
+            base_url="https://test.app.n8n.cloud",
+            api_key="test-api-key",
+            timeout=30,
+            max_retries=3,
+        ),
+        performance=SimpleNamespace(cache_ttl=300),
+    )
 
-@pytest.fixture
+# The data fixtures below are shared for the whole session; tests must not
+# mutate them and should copy them first if they need to.
+@pytest.fixture(scope="session")
 def mock_workflow_data():
     """Fixture for mock workflow data."""
     return {
@@ -30,7 +42,7 @@ def mock_workflow(mock_workflow_data):
     """Fixture for a mock WorkflowModel instance."""
     return WorkflowModel(**mock_workflow_data)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_response_workflow():
     """Fixture for a mock API response for a single workflow."""
     return {
@@ -42,7 +54,7 @@ def mock_api_response_workflow():
         "tags": [],
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_response_workflows_list():
     """Fixture for a mock API response for a list of workflows."""
     return {
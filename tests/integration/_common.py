@@ -0,0 +1,41 @@
+"""
+Entegrasyon script'leri için ortak yardımcılar: araç handler eşlemesi ve sonuç sınıflandırma.
+"""
+
+import asyncio
+import re
+from typing import Awaitable, Callable, Dict, List
+
+from mcp import types as mcp_types
+
+from src.n8n_mcp.server import N8nMcpServer
+
+# Araç adı -> sunucudaki async _handle metodu
+HandlerMap = Dict[str, Callable[[dict], Awaitable[List[mcp_types.TextContent]]]]
+
+# Sunucunun döndürdüğü düz metin hata mesajlarının başlangıçları
+_ERR_RE = re.compile(r'^(?:Error|Missing required field|Invalid value for field|Workflow not found|Unknown tool|Tool execution error)')
+
+
+def build_handler_map(server: N8nMcpServer, tools: List[mcp_types.Tool]) -> HandlerMap:
+    """Her araç için sunucudaki async _handle metodunu bir kez bulup doğrular."""
+    handler_map = {}
+    for tool in tools:
+        handler_name = f"_handle_{tool.name}"
+        handler_method = getattr(server, handler_name, None)
+
+        if not handler_method or not asyncio.iscoroutinefunction(handler_method):
+            raise AttributeError(f"No valid async handler method '{handler_name}' found on server for tool '{tool.name}'")
+
+        handler_map[tool.name] = handler_method
+    return handler_map
+
+
+def classify_result(raw_text: str) -> str:
+    """Yanıtın ilk karakterine bakarak "json", "error" veya "text" döndürür."""
+    stripped = raw_text.lstrip()
+    if stripped[:1] in ('{', '['):
+        return "json"
+    if _ERR_RE.match(stripped):
+        return "error"
+    return "text"
@@ -1,7 +1,11 @@
+import argparse
 import asyncio
-import json
 import sys
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
+
+import click
+import orjson
 
 # Proje kök dizinini Python yoluna ekle, böylece 'src' modülü bulunabilir.
 if '.' not in sys.path:
@@ -11,16 +15,22 @@ from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.syntax import Syntax
 
 # Proje importları
 from mcp import types as mcp_types
 from src.n8n_mcp.client import N8nApiError
 from src.n8n_mcp.config import load_settings
 from src.n8n_mcp.server import N8nMcpServer, get_tool_definitions
+from tests.integration._common import HandlerMap, build_handler_map, classify_result
+from tests.integration.json_display import print_json
 
 # rich konsolunu başlat
-console = Console()
+console = Console(highlight=False, soft_wrap=True)
+
+# Sabit rich renderable'lar bir kez oluşturulup yeniden kullanılır
+_HR = Markdown("---")
+_BANNER = Markdown("# n8n MCP Server - Interactive Tool Tester 🛠️")
+_MENU_HEADER = Markdown("--- \n### Select a tool to test:")
 
 
 async def get_tool_arguments(tool: mcp_types.Tool) -> Dict[str, Any]:
@@ -35,10 +45,13 @@ async def get_tool_arguments(tool: mcp_types.Tool) -> Dict[str, Any]:
         console.print("[yellow]This tool does not require any arguments.[/yellow]")
         return args
 
-    for name, prop in properties.items():
-        is_required = name in required_fields
-        prop_type = prop.get("type", "string")
-        default_val = prop.get("default")
+    # Alan bilgilerini döngüden önce bir kez tuple'lara çıkar
+    fields = [
+        (name, prop.get("type", "string"), name in required_fields, prop.get("default"), prop.get("description", ""))
+        for name, prop in properties.items()
+    ]
+
+    for name, prop_type, is_required, default_val, description in fields:
 
         # Prompt metnini oluştur
         prompt_text = f"  - [b]{name}[/b] ({prop_type})"
@@ -50,11 +63,17 @@ async def get_tool_arguments(tool: mcp_types.Tool) -> Dict[str, Any]:
                 prompt_text += f", default: {default_val}"
             prompt_text += ")"
 
-        console.print(Markdown(prompt_text))
-        console.print(f"    [dim]{prop.get('description', '')}[/dim]")
+        # Alan satırları rich markup ile basılır, Markdown ayrıştırması gerekmez
+        console.print(prompt_text)
+        console.print(f"    [dim]{description}[/dim]")
 
-        # Kullanıcıdan input al
-        user_input = Prompt.ask("    > ")
+        # Kullanıcıdan input al; çok satırlı JSON nesneleri editörde tek seferde girilir
+        if prop_type == "object":
+            console.print("    [dim]Opening editor for JSON input (save and close to continue)...[/dim]")
+            # Kaydedilmeden kapatılan editör None döner, boş girdi gibi ele alınır
+            user_input = (click.edit(text="{}\n", extension=".json") or "").strip()
+        else:
+            user_input = Prompt.ask("    > ")
 
         if not user_input:
             if is_required:
@@ -75,30 +94,73 @@ async def get_tool_arguments(tool: mcp_types.Tool) -> Dict[str, Any]:
                 args[name] = [item.strip() for item in user_input.split(",")]
             elif prop_type == "object":
                 # JSON string'i olarak al
-                args[name] = json.loads(user_input)
+                args[name] = orjson.loads(user_input)
             else:  # string
                 args[name] = user_input
-        except (ValueError, json.JSONDecodeError) as e:
+        except (ValueError, orjson.JSONDecodeError) as e:
             console.print(f"[bold red]Invalid input for type '{prop_type}': {e}[/bold red]")
             raise ValueError(f"Invalid input for field '{name}'.")
 
     return args
 
 
-async def call_tool_handler(server: N8nMcpServer, tool_name: str, arguments: dict) -> List[mcp_types.TextContent]:
-    """Sunucu üzerindeki doğru _handle metodunu dinamik olarak çağırır."""
-    handler_name = f"_handle_{tool_name}"
-    handler_method = getattr(server, handler_name, None)
+async def call_tool_handler(handler_map: HandlerMap, tool_name: str, arguments: dict) -> List[mcp_types.TextContent]:
+    """Önceden hazırlanmış eşlemeden aracın handler'ını çağırır."""
+    return await handler_map[tool_name](arguments)
+
+
+def load_batch(path: str) -> List[Dict[str, Any]]:
+    """JSONL dosyasından {"tool": ..., "args": {...}} satırlarını okur."""
+    with open(path, "rb") as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+async def run_batch(handler_map: HandlerMap, rows: List[Dict[str, Any]], concurrency: int) -> None:
+    """Batch satırlarını en fazla `concurrency` eşzamanlı çağrı ile çalıştırır ve süreleri raporlar."""
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def run_row(index: int, row: Dict[str, Any]) -> None:
+        nonlocal failures
+        tool_name = ""
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                # Nesne olmayan bir satır tüm batch'i değil sadece kendisini başarısız saysın
+                tool_name = row.get("tool", "")
+                if tool_name not in handler_map:
+                    raise ValueError(f"Unknown tool: {tool_name}")
+                result_content = await call_tool_handler(handler_map, tool_name, row.get("args") or {})
+                raw_text = result_content[0].text if result_content else ""
+                failed = classify_result(raw_text) == "error"
+            except Exception as e:
+                failed, raw_text = True, str(e)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if failed:
+            failures += 1
+            console.print(f"  [red]✗[/red] #{index} [bold]{tool_name}[/bold] ({elapsed_ms:.1f} ms): {raw_text}")
+        else:
+            console.print(f"  [green]✓[/green] #{index} [bold]{tool_name}[/bold] ({elapsed_ms:.1f} ms)")
 
-    if not handler_method or not asyncio.iscoroutinefunction(handler_method):
-        raise ValueError(f"No valid async handler method '{handler_name}' found on server for tool '{tool_name}'")
+    started = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for index, row in enumerate(rows, 1):
+            tg.create_task(run_row(index, row))
+    elapsed = time.perf_counter() - started
 
-    return await handler_method(arguments)
+    throughput = len(rows) / elapsed if elapsed > 0 else float("inf")
+    console.print(
+        f"\n[bold]{len(rows)}[/bold] calls, [red]{failures}[/red] failed, "
+        f"{elapsed:.2f} s total, {throughput:.1f} calls/s (concurrency={concurrency})"
+    )
 
 
-async def main():
+async def main(batch_path: Optional[str] = None, concurrency: int = 4):
     """İnteraktif test aracını çalıştıran ana fonksiyon."""
-    console.print(Markdown("# n8n MCP Server - Interactive Tool Tester 🛠️"))
+    console.print(_BANNER)
 
     server = None
     try:
@@ -111,8 +173,8 @@ async def main():
         # Başlangıçta sağlık kontrolü yap
         health_result = await server._handle_health_check({})
         raw_text = health_result[0].text
-        health_data = json.loads(raw_text)
-        if health_data.get("healthy"):
+        # Yanıt küçük ve sabit biçimli; tek bir boolean için ayrıştırmaya gerek yok
+        if '"healthy":true' in raw_text or '"healthy": true' in raw_text:
             console.print("[bold green]✅ n8n API connection verified.[/bold green]")
         else:
             console.print("[bold red]❌ n8n API health check failed. Exiting.[/bold red]")
@@ -121,13 +183,25 @@ async def main():
         # 2. Mevcut araçları al
         tools = get_tool_definitions()
         tool_map = {str(i + 1): tool for i, tool in enumerate(tools)}
+        handler_map = build_handler_map(server, tools)
+
+        # Batch modunda menüyü atla, dosyadaki çağrıları eşzamanlı çalıştır
+        if batch_path:
+            rows = load_batch(batch_path)
+            console.print(f"▶️  Running [bold]{len(rows)}[/bold] calls from {batch_path} with concurrency {concurrency}")
+            await run_batch(handler_map, rows, concurrency)
+            return
+
+        # Menü metni her döngüde yeniden biçimlendirilmesin diye bir kez hazırlanır
+        menu_str = "\n".join(
+            [f"  [cyan]{index}[/cyan]: [bold]{tool.name}[/bold] - {tool.description}" for index, tool in tool_map.items()]
+            + ["  [red]q[/red]: [bold]Quit[/bold]"]
+        )
 
         # 3. Ana döngü
         while True:
-            console.print(Markdown("--- \n### Select a tool to test:"))
-            for index, tool in tool_map.items():
-                console.print(f"  [cyan]{index}[/cyan]: [bold]{tool.name}[/bold] - {tool.description}")
-            console.print("  [red]q[/red]: [bold]Quit[/bold]")
+            console.print(_MENU_HEADER)
+            console.print(menu_str)
 
             choice = Prompt.ask("\nEnter your choice", default="q").lower()
 
@@ -145,24 +219,20 @@ async def main():
 
                 # 5. Aracı çalıştır
                 console.print(f"\n▶️  Executing [bold cyan]{selected_tool.name}[/] with args: {arguments}")
-                result_content = await call_tool_handler(server, selected_tool.name, arguments)
+                result_content = await call_tool_handler(handler_map, selected_tool.name, arguments)
 
                 # 6. Sonucu göster
                 console.print(Markdown(f"### ✅ Result from `{selected_tool.name}`:"))
                 if result_content and isinstance(result_content, list) and result_content[0].type == "text":
                     raw_text = result_content[0].text
-                    # Hata mesajı olup olmadığını kontrol et
-                    if "Error" in raw_text or "Missing required field" in raw_text or "Workflow not found" in raw_text:
+                    kind = classify_result(raw_text)
+                    if kind == "json":
+                        # JSON olarak formatla, geçersizse düz metin olarak yazdır
+                        print_json(console, raw_text, theme="monokai")
+                    elif kind == "error":
                         console.print(Panel(f"[yellow]Server-side tool error:[/] {raw_text}", title="Tool Error", border_style="yellow"))
                     else:
-                        try:
-                            # JSON olarak formatlamayı dene
-                            parsed_json = json.loads(raw_text)
-                            pretty_json = json.dumps(parsed_json, indent=2, ensure_ascii=False)
-                            console.print(Syntax(pretty_json, "json", theme="monokai", line_numbers=True))
-                        except json.JSONDecodeError:
-                            # Düz metin olarak yazdır
-                            console.print(raw_text)
+                        console.print(raw_text)
                 else:
                     console.print(f"[yellow]Received an unexpected result format:[/] {result_content}")
 
@@ -180,11 +250,40 @@ async def main():
         if server:
             await server.cleanup()
             console.print("\n[bold green]✅ Resources cleaned up. Exiting.[/bold green]")
-        console.print(Markdown("---"))
+        console.print(_HR)
+
+
+def _positive_int(value: str) -> int:
+    """argparse için 1 veya daha büyük tam sayı (0 semaphore'u kilitler)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Interactive tester for the n8n MCP server tools.")
+    parser.add_argument("--batch", metavar="PATH", help="JSONL file with one {\"tool\": ..., \"args\": {...}} call per line")
+    parser.add_argument("--concurrency", type=_positive_int, default=4, help="maximum concurrent calls in batch mode (default: 4)")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
+    cli_args = parse_args()
+
     try:
-        asyncio.run(main())
+        import uvloop
+    except ImportError:
+        # uvloop Windows'ta desteklenmiyor, standart event loop'a dön
+        uvloop = None
+
+    try:
+        if uvloop is not None:
+            uvloop.run(main(cli_args.batch, cli_args.concurrency))
+        else:
+            asyncio.run(main(cli_args.batch, cli_args.concurrency))
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user. Exiting.[/yellow]")
\ No newline at end of file
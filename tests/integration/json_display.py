@@ -0,0 +1,123 @@
+"""
+Entegrasyon script'leri için ortak JSON gösterim yardımcıları.
+
+Küçük yanıtlar orjson ile tek seferde girintilenir; büyük yanıtlar ise
+ijson olaylarından satır satır üretilip parça parça basılır. Ham yanıt
+(ve byte kopyası) yine bellekte durur; kazanç, girintili metnin tamamının
+ve tek dev Syntax bloğunun hiç oluşturulmamasıdır.
+"""
+
+from typing import Iterable, Iterator
+
+import ijson
+import orjson
+from rich.console import Console
+from rich.syntax import Syntax
+
+# Bu boyutun üzerindeki yanıtlar akış halinde basılır
+STREAM_THRESHOLD = 64 * 1024
+
+# Akış modunda tek bir Syntax bloğuna konan satır sayısı
+_CHUNK_LINES = 500
+
+_INDENT = "  "
+
+# Girintili (pretty) JSON'un başlangıçları
+_PRETTY_PREFIXES = ("{\n  ", "[\n  ")
+
+
+def iter_pretty_json_lines(data: bytes) -> Iterator[str]:
+    """JSON verisini ayrıştırıp iki boşlukla girintilenmiş satırlar olarak üretir."""
+    # Son üretilen satır bekletilir; aynı seviyede yeni bir değer gelirse sonuna virgül eklenir
+    pending = None
+    # Her açık container için "en az bir elemanı var mı" bilgisi
+    has_items = []
+    key = None
+
+    for _, event, value in ijson.parse(data, use_float=True):
+        if event == "map_key":
+            key = value
+            continue
+
+        if event in ("end_map", "end_array"):
+            close = "}" if event == "end_map" else "]"
+            if has_items.pop():
+                yield pending
+                pending = _INDENT * len(has_items) + close
+            else:
+                # Boş container açıldığı satırda kapanır
+                pending += close
+            continue
+
+        if has_items:
+            if has_items[-1]:
+                pending += ","
+            has_items[-1] = True
+        if pending is not None:
+            yield pending
+
+        line = _INDENT * len(has_items)
+        if key is not None:
+            line += orjson.dumps(key).decode() + ": "
+            key = None
+
+        if event == "start_map":
+            pending = line + "{"
+            has_items.append(False)
+        elif event == "start_array":
+            pending = line + "["
+            has_items.append(False)
+        else:
+            pending = line + orjson.dumps(value).decode()
+
+    if pending is not None:
+        yield pending
+
+
+def print_json(console: Console, raw_text: str, theme: str) -> None:
+    """JSON metnini girintili ve satır numaralı olarak basar; geçersizse düz metin basar."""
+    # Büyük yanıtlar, zaten girintili olsalar bile tek bir Syntax bloğuna konmaz
+    if len(raw_text) > STREAM_THRESHOLD:
+        if raw_text.startswith(_PRETTY_PREFIXES):
+            _print_chunked(console, raw_text.splitlines(), theme)
+        else:
+            _print_json_streamed(console, raw_text, theme)
+        return
+
+    # Zaten girintili gelen yanıtı yeniden ayrıştırıp biçimlendirmeye gerek yok
+    if raw_text.startswith(_PRETTY_PREFIXES):
+        console.print(Syntax(raw_text, "json", theme=theme, line_numbers=True))
+        return
+
+    try:
+        parsed_json = orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
+        console.print(raw_text)
+        return
+
+    pretty_json = orjson.dumps(parsed_json, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    console.print(Syntax(pretty_json, "json", theme=theme, line_numbers=True))
+
+
+def _print_chunked(console: Console, lines: Iterable[str], theme: str) -> None:
+    """Satırları sabit boyutlu, satır numaraları kesintisiz Syntax blokları halinde basar."""
+    chunk = []
+    start_line = 1
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == _CHUNK_LINES:
+            console.print(Syntax("\n".join(chunk), "json", theme=theme, line_numbers=True, start_line=start_line))
+            start_line += len(chunk)
+            chunk.clear()
+
+    if chunk:
+        console.print(Syntax("\n".join(chunk), "json", theme=theme, line_numbers=True, start_line=start_line))
+
+
+def _print_json_streamed(console: Console, raw_text: str, theme: str) -> None:
+    """Büyük JSON metnini ayrıştırarak girintili satır blokları halinde basar."""
+    try:
+        _print_chunked(console, iter_pretty_json_lines(raw_text.encode()), theme)
+    except ijson.JSONError as e:
+        console.print(f"[yellow]Response is not valid JSON ({e}), printing raw text:[/]")
+        console.print(raw_text)
@@ -1,6 +1,10 @@
+import asyncio
 import pytest
 import httpx
-from unittest.mock import AsyncMock, patch
+import orjson
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import ValidationError
 from src.n8n_mcp.client import N8nApiClient, N8nApiError, WorkflowModel
 
 @pytest.fixture
@@ -24,7 +28,7 @@ async def test_create_workflow_success(client: N8nApiClient, mocker: AsyncMock):
     created_workflow = await client.create_workflow(workflow_data)
 
     client._make_request.assert_called_once_with(
-        "POST", "/workflows", data=workflow_data.model_dump(exclude_unset=True, exclude_none=True)
+        "POST", "/workflows", data=workflow_data.model_dump(mode="json", exclude_unset=True, exclude_none=True)
     )
     assert created_workflow.id == "123"
     assert created_workflow.name == "Test Workflow"
@@ -46,13 +50,387 @@ async def test_make_request_retry(client: N8nApiClient, mocker: AsyncMock):
     """Test the retry mechanism in _make_request."""
     mocker.patch.object(client.client, 'request', side_effect=[
         httpx.TimeoutException("Timeout!"),
-        AsyncMock(status_code=200, json=lambda: {"status": "success"})
+        AsyncMock(status_code=200, content=b'{"status": "success"}')
     ])
-    
-    # We need to patch the asyncio.sleep to avoid waiting in tests
-    mocker.patch('asyncio.sleep', return_value=None)
 
     response = await client._make_request("GET", "/test")
 
     assert client.client.request.call_count == 2
-    assert response == {"status": "success"}
\ No newline at end of file
+    assert response == {"status": "success"}
+
+@pytest.mark.asyncio
+async def test_search_workflows_falls_back_to_local_index(client: N8nApiClient):
+    """Test that search falls back to a streamed scan, then to the warm index, when server-side filtering is rejected."""
+    workflows = [
+        {"id": "1", "name": "Invoice Sync", "tags": []},
+        {"id": "2", "name": "Slack Alerts", "tags": [{"name": "invoice"}]},
+        {"id": "3", "name": "Daily Report", "tags": []},
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "name" in request.url.params:
+            return httpx.Response(400, json={"message": "Unknown query parameter 'name'"})
+        return httpx.Response(200, json={"data": workflows, "nextCursor": None})
+
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    found = await client.search_workflows("invoice")
+    found_again = await client.search_workflows("invoice")
+
+    assert [workflow.id for workflow in found] == ["1", "2"]
+    assert [workflow.id for workflow in found_again] == ["1", "2"]
+    assert client._server_search_supported is False
+    assert len(requests) == 2
+
+@pytest.mark.asyncio
+async def test_search_workflows_detects_ignored_name_filter(client: N8nApiClient):
+    """Test that an unfiltered 200 response to the name filter is not trusted as server-side search."""
+    workflows = [
+        {"id": "1", "name": "Daily Report", "tags": []},
+        {"id": "2", "name": "Slack Alerts", "tags": [{"name": "invoice"}]},
+        {"id": "3", "name": "Invoice Sync", "tags": []},
+    ]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"data": workflows, "nextCursor": None})
+
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    found = await client.search_workflows("invoice")
+    found_again = await client.search_workflows("invoice")
+
+    assert [workflow.id for workflow in found] == ["2", "3"]
+    assert [workflow.id for workflow in found_again] == ["2", "3"]
+    assert client._server_search_supported is False
+    assert len(requests) == 2
+
+@pytest.mark.asyncio
+async def test_search_workflows_retries_streamed_scan_on_server_error(client: N8nApiClient, no_sleep: AsyncMock):
+    """Test that a 5xx on the streamed scan falls back to the retrying request path."""
+    workflows = [
+        {"id": "1", "name": "Daily Report", "tags": []},
+        {"id": "2", "name": "Invoice Sync", "tags": []},
+    ]
+    scans = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "name" in request.url.params:
+            return httpx.Response(400, json={"message": "unknown filter"})
+        scans.append(request)
+        if len(scans) <= 2:
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json={"data": workflows, "nextCursor": None})
+
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    found = await client.search_workflows("invoice")
+
+    assert [workflow.id for workflow in found] == ["2"]
+    assert len(scans) == 3
+    assert no_sleep.await_count == 1
+
+@pytest.mark.asyncio
+async def test_search_workflows_reports_malformed_stream_as_api_error(client: N8nApiClient):
+    """Test that a JSON parse error on the streamed scan surfaces as N8nApiError."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "name" in request.url.params:
+            return httpx.Response(400, json={"message": "unknown filter"})
+        return httpx.Response(200, content=b'{"data": [{"id": "1", "name": ')
+
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    with pytest.raises(N8nApiError):
+        await client.search_workflows("invoice")
+
+@pytest.mark.asyncio
+async def test_search_workflows_uses_verified_name_filter(client: N8nApiClient):
+    """Test that a verified name-filtered response filling the limit is returned without a local scan."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        name = request.url.params["name"]
+        return httpx.Response(200, json={"data": [{"id": "1", "name": f"{name} Sync"}], "nextCursor": None})
+
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    found = await client.search_workflows("Invoice", limit=1)
+
+    assert [workflow.id for workflow in found] == ["1"]
+    assert client._server_search_supported is True
+    assert len(requests) == 1
+
+def test_invalidate_workflow_keeps_unrelated_cache_entries(client: N8nApiClient):
+    """Test that a workflow mutation only evicts the list and that workflow's cache entries."""
+    list_key = ("GET", "/workflows", (("limit", 20),))
+    first_key = ("GET", "/workflows/1", ())
+    second_key = ("GET", "/workflows/2", ())
+    client._set_cache(list_key, "/workflows", {"data": []})
+    client._set_cache(first_key, "/workflows/1", {"id": "1"})
+    client._set_cache(second_key, "/workflows/2", {"id": "2"})
+
+    client._invalidate_workflow("1")
+
+    assert client._get_from_cache(list_key) is None
+    assert client._get_from_cache(first_key) is None
+    assert client._get_from_cache(second_key) == {"id": "2"}
+
+@pytest.mark.asyncio
+async def test_make_request_retries_server_errors_only(client: N8nApiClient, mocker: AsyncMock, no_sleep: AsyncMock):
+    """Test that 5xx/429 responses are retried while other 4xx responses are not."""
+    unavailable = MagicMock(status_code=503, headers={}, content=b'{"message": "Unavailable"}')
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "2"}, content=b'{"message": "Slow down"}')
+    success = MagicMock(status_code=200, content=b'{"status": "success"}')
+    mocker.patch.object(client.client, 'request', side_effect=[unavailable, throttled, success])
+
+    response = await client._make_request("GET", "/test")
+
+    assert response == {"status": "success"}
+    assert client.client.request.call_count == 3
+    assert no_sleep.call_args_list[1].args == (2.0,)
+
+    not_found = MagicMock(status_code=404, headers={}, content=b'{"message": "Not Found"}')
+    client.client.request.reset_mock(side_effect=True)
+    client.client.request.return_value = not_found
+
+    with pytest.raises(N8nApiError) as exc_info:
+        await client._make_request("GET", "/missing")
+
+    assert exc_info.value.status_code == 404
+    assert client.client.request.call_count == 1
+
+@pytest.mark.asyncio
+async def test_make_request_does_not_retry_post_on_server_error(client: N8nApiClient, mocker: AsyncMock):
+    """Test that a non-idempotent POST is not retried after a 5xx response."""
+    server_error = MagicMock(status_code=500, headers={}, content=b'{"message": "Internal error"}')
+    mocker.patch.object(client.client, 'request', return_value=server_error)
+
+    with pytest.raises(N8nApiError) as exc_info:
+        await client._make_request("POST", "/executions", data={"workflowData": {"id": "1"}})
+
+    assert exc_info.value.status_code == 500
+    assert client.client.request.call_count == 1
+
+@pytest.mark.asyncio
+async def test_make_request_retries_post_only_when_unsent(client: N8nApiClient, mocker: AsyncMock):
+    """Test that a POST is sent once after a read timeout but retried after a connect error."""
+    mocker.patch.object(client.client, 'request', side_effect=httpx.ReadTimeout("Read timed out"))
+
+    with pytest.raises(N8nApiError, match="Request timeout"):
+        await client._make_request("POST", "/executions", data={"workflowData": {"id": "1"}})
+
+    assert client.client.request.call_count == 1
+
+    success = MagicMock(status_code=200, content=b'{"id": "e1"}')
+    client.client.request.reset_mock(side_effect=True)
+    client.client.request.side_effect = [httpx.ConnectError("Connection refused"), success]
+
+    assert await client._make_request("POST", "/executions", data={"workflowData": {"id": "1"}}) == {"id": "e1"}
+    assert client.client.request.call_count == 2
+
+@pytest.mark.asyncio
+async def test_get_workflows_caps_concurrency_and_keeps_order(mocker: AsyncMock):
+    """Test that get_workflows respects the semaphore and returns None for missing ids in place."""
+    client = N8nApiClient(base_url="https://test.n8n.cloud", api_key="test_api_key", max_concurrent_requests=2)
+    active = 0
+    peak = 0
+    full = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fake_request(method, endpoint, use_cache=True):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        if active == 2:
+            full.set()
+        try:
+            await release.wait()
+        finally:
+            active -= 1
+        workflow_id = endpoint.rsplit("/", 1)[-1]
+        if workflow_id == "missing":
+            raise N8nApiError("Not Found", status_code=404)
+        return {"id": workflow_id, "name": f"Workflow {workflow_id}"}
+
+    mocker.patch.object(client, '_make_request', side_effect=fake_request)
+
+    task = asyncio.create_task(client.get_workflows(["1", "missing", "3", "4", "5"]))
+    await full.wait()
+    assert active == 2
+    release.set()
+    workflows = await task
+
+    assert peak == 2
+    assert [workflow.id if workflow else None for workflow in workflows] == ["1", None, "3", "4", "5"]
+
+@pytest.mark.asyncio
+async def test_make_request_coalesces_concurrent_gets(client: N8nApiClient, mocker: AsyncMock):
+    """Test that identical concurrent cached GETs share a single HTTP request."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_request(**kwargs):
+        started.set()
+        await release.wait()
+        return MagicMock(status_code=200, headers={}, content=b'{"id": "1"}')
+
+    mocker.patch.object(client.client, 'request', side_effect=slow_request)
+
+    async def release_when_started():
+        await started.wait()
+        release.set()
+
+    first, second, _ = await asyncio.gather(
+        client._make_request("GET", "/workflows/1", use_cache=True),
+        client._make_request("GET", "/workflows/1", use_cache=True),
+        release_when_started(),
+    )
+
+    assert first == second == {"id": "1"}
+    assert client.client.request.call_count == 1
+
+@pytest.mark.asyncio
+async def test_make_request_leader_cancellation_does_not_cancel_joiners(client: N8nApiClient, mocker: AsyncMock):
+    """Test that cancelling the coalescing leader makes its joiner retry instead of being cancelled."""
+    leader_started = asyncio.Event()
+    joiner_waiting = asyncio.Event()
+    calls = 0
+
+    async def request(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            leader_started.set()
+            await asyncio.Event().wait()
+        return MagicMock(status_code=200, headers={}, content=b'{"id": "1"}')
+
+    mocker.patch.object(client.client, 'request', side_effect=request)
+
+    leader = asyncio.create_task(client._make_request("GET", "/workflows/1", use_cache=True))
+    await leader_started.wait()
+
+    original_shield = asyncio.shield
+
+    def shield(future):
+        joiner_waiting.set()
+        return original_shield(future)
+
+    mocker.patch("asyncio.shield", side_effect=shield)
+    joiner = asyncio.create_task(client._make_request("GET", "/workflows/1", use_cache=True))
+    await joiner_waiting.wait()
+
+    leader.cancel()
+
+    assert await joiner == {"id": "1"}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert client.client.request.call_count == 2
+    assert client._inflight == {}
+
+def test_fast_dump_matches_model_dump():
+    """Test that the specialized dumper matches pydantic's exclude_unset/exclude_none dump."""
+    workflows = [
+        WorkflowModel(name="Only Name"),
+        WorkflowModel(name="Full", nodes=[{"name": "Start"}], connections={}, active=True, tags=[{"name": "x"}]),
+        WorkflowModel(name="With None", settings=None, createdAt="2024-01-01T00:00:00Z"),
+    ]
+
+    for workflow in workflows:
+        assert workflow.fast_dump() == workflow.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+
+
+@pytest.mark.asyncio
+async def test_make_request_revalidates_expired_entries_with_etag():
+    """Test that an expired cache entry is revalidated with If-None-Match and reused on 304."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            # A 304 may omit the validators; the cached ones must be kept
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": "1"}, headers={"ETag": '"v1"'})
+
+    client = N8nApiClient(base_url="https://test.n8n.cloud", api_key="test_api_key", cache_ttl=0)
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    first = await client._make_request("GET", "/workflows/1", use_cache=True)
+    second = await client._make_request("GET", "/workflows/1", use_cache=True)
+    third = await client._make_request("GET", "/workflows/1", use_cache=True)
+
+    assert first == second == third == {"id": "1"}
+    assert len(requests) == 3
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert requests[2].headers["If-None-Match"] == '"v1"'
+
+
+def test_workflow_summary_is_cached():
+    """Test that the listing summary is computed once and cached."""
+    workflow = WorkflowModel(id="1", name="Flow", nodes=[{"name": "Start"}], active=True)
+
+    assert workflow.summary == {"id": "1", "name": "Flow", "active": True, "nodes_count": 1}
+    assert workflow.summary is workflow.summary
+
+    copied = workflow.model_copy(update={"name": "Renamed", "nodes": []})
+    assert copied.summary == {"id": "1", "name": "Renamed", "active": True, "nodes_count": 0}
+
+
+@pytest.mark.asyncio
+async def test_streamed_scan_keeps_floats_serializable(client: N8nApiClient):
+    """Test that float node parameters from the streamed scan survive cache reuse and re-serialization."""
+    workflows = [
+        {"id": "1", "name": "Invoice Sync", "nodes": [{"name": "Wait", "parameters": {"amount": 1.5}}], "tags": []},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "name" in request.url.params:
+            return httpx.Response(400, json={"message": "Unknown query parameter 'name'"})
+        return httpx.Response(200, json={"data": workflows, "nextCursor": None})
+
+    client.client = httpx.AsyncClient(base_url="https://test.n8n.cloud/api/v1", transport=httpx.MockTransport(handler))
+
+    await client.search_workflows("invoice")
+    listed = await client.list_workflows(limit=100)
+
+    assert listed[0].nodes[0]["parameters"]["amount"] == 1.5
+    assert orjson.loads(orjson.dumps(listed[0].fast_dump()))["nodes"] == workflows[0]["nodes"]
+
+
+@pytest.mark.parametrize("value", [
+    "2024-01-02T03:04:05.678Z",
+    "2024-01-02T06:04:05.678+03:00",
+    "2024-01-02T03:04:05.678",
+    1704164645678,
+])
+def test_workflow_timestamps_normalize_to_epoch_ms(value):
+    """Test that ISO (with and without offset, naive as UTC) and epoch-ms timestamps map to the same instant."""
+    workflow = WorkflowModel(name="Flow", createdAt=value, updatedAt=value)
+
+    assert workflow.createdAt == workflow.updatedAt == 1704164645678
+    assert workflow.createdAt_dt == workflow.updatedAt_dt == datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+
+
+def test_workflow_timestamp_properties_are_none_when_unset():
+    """Test that the datetime views are None when the timestamps are missing."""
+    workflow = WorkflowModel(name="Flow")
+
+    assert workflow.createdAt_dt is None
+    assert workflow.updatedAt_dt is None
+
+
+def test_workflow_search_text_follows_copies():
+    """Test that the cached search text is rebuilt for updated copies and the model cannot be mutated in place."""
+    workflow = WorkflowModel(name="Alpha", tags=[{"name": "Ops"}])
+    assert workflow.search_text == "alpha\0ops"
+
+    renamed = workflow.model_copy(update={"name": "Beta"})
+
+    assert renamed.search_text == "beta\0ops"
+    assert workflow.search_text == "alpha\0ops"
+    with pytest.raises(ValidationError):
+        workflow.name = "Gamma"
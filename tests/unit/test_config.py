@@ -0,0 +1,67 @@
+import pytest
+
+from src.n8n_mcp.config import Settings
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Clear config-related variables and disable .env discovery."""
+    for name in ("N8N_BASE_URL", "N8N_API_KEY", "MCP_SERVER_NAME", "LOG_LEVEL"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr("dotenv.find_dotenv", lambda: "")
+    return monkeypatch
+
+def test_from_dict_values_take_precedence_over_nested_env(clean_env):
+    """Test that SECTION__FIELD variables only fill in fields the config leaves unset."""
+    clean_env.setenv("PERFORMANCE__CACHE_TTL", "60")
+    clean_env.setenv("PERFORMANCE__MAX_CONCURRENT_REQUESTS", "3")
+
+    settings = Settings.from_dict({
+        "n8n": {"base_url": "https://test.app.n8n.cloud", "api_key": "test-api-key"},
+        "performance": {"cache_ttl": 5},
+    })
+
+    assert settings.performance.cache_ttl == 5
+    assert settings.performance.max_concurrent_requests == 3
+
+def test_nested_env_keys_are_case_insensitive_and_decoded(clean_env):
+    """Test deep SECTION__FIELD__KEY variables and decoding of non-string values."""
+    clean_env.setenv("security__rate_limiting__enabled", "false")
+    clean_env.setenv("SECURITY__RATE_LIMITING__REQUESTS_PER_MINUTE", "50")
+    clean_env.setenv("N8N__API_KEY", "1234567890")
+    clean_env.setenv("N8N__BASE_URL", "https://env.app.n8n.cloud")
+
+    settings = Settings.from_dict({})
+
+    assert settings.security.rate_limiting == {"enabled": False, "requests_per_minute": 50}
+    assert settings.n8n.api_key == "1234567890"
+    assert settings.n8n.base_url == "https://env.app.n8n.cloud"
+
+def test_load_from_env_requires_base_url_and_api_key(clean_env):
+    """Test that missing required variables raise a clear error."""
+    with pytest.raises(ValueError, match="N8N_BASE_URL"):
+        Settings.load_from_env()
+
+    clean_env.setenv("N8N_BASE_URL", "https://test.app.n8n.cloud")
+    with pytest.raises(ValueError, match="N8N_API_KEY"):
+        Settings.load_from_env()
+
+def test_load_from_env_merges_flat_and_nested_variables(clean_env):
+    """Test that flat variables build the config and nested ones fill the remaining sections."""
+    clean_env.setenv("N8N_BASE_URL", "https://test.app.n8n.cloud")
+    clean_env.setenv("N8N_API_KEY", "test-api-key")
+    clean_env.setenv("PERFORMANCE__CACHE_TTL", "60")
+
+    settings = Settings.load_from_env()
+
+    assert settings.n8n.base_url == "https://test.app.n8n.cloud"
+    assert settings.performance.cache_ttl == 60
+
+def test_to_dict_round_trips_through_from_dict(clean_env):
+    """Test that to_dict output rebuilds equal settings."""
+    settings = Settings.from_dict({
+        "n8n": {"base_url": "https://test.app.n8n.cloud", "api_key": "test-api-key", "timeout": 10},
+        "logging": {"level": "DEBUG", "file": "logs/app.log"},
+        "security": {"rate_limiting": {"enabled": False, "requests_per_minute": 5}},
+    })
+
+    assert Settings.from_dict(settings.to_dict()) == settings
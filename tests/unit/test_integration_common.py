@@ -0,0 +1,16 @@
+import pytest
+
+from tests.integration._common import classify_result
+
+@pytest.mark.parametrize("raw_text, expected", [
+    ('{"id": "1"}', "json"),
+    ('  \n[1, 2]', "json"),
+    ("Workflow not found: abc", "error"),
+    ("Missing required field: name", "error"),
+    ("Tool execution error: boom", "error"),
+    ("Workflow deleted successfully", "text"),
+    ("", "text"),
+])
+def test_classify_result(raw_text, expected):
+    """Test that tool results are classified by their first character and error prefixes."""
+    assert classify_result(raw_text) == expected
@@ -0,0 +1,38 @@
+import pytest
+import orjson
+from rich.console import Console
+
+from tests.integration import json_display
+from tests.integration.json_display import iter_pretty_json_lines, print_json
+
+@pytest.mark.parametrize("value", [
+    {"id": "1", "nodes": [{"name": "Start", "parameters": {"amount": 1.5, "tags": ["a", "b"]}}], "active": True},
+    [[1, [2, {"deep": {"deeper": [None, False]}}]], {"k": "v"}],
+    {"empty_map": {}, "empty_list": [], "nested": [{}, [], {"x": []}]},
+    {},
+    [],
+    "text with \"quotes\" and ünicode",
+    42,
+    -0.25,
+    True,
+    None,
+])
+def test_iter_pretty_json_lines_matches_orjson_indent(value):
+    """Test that the streamed pretty-printer produces exactly orjson's OPT_INDENT_2 output."""
+    data = orjson.dumps(value)
+
+    assert "\n".join(iter_pretty_json_lines(data)) == orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+def test_print_json_chunks_large_indented_responses(monkeypatch):
+    """Test that an already-indented response over the threshold is still printed in chunks."""
+    monkeypatch.setattr(json_display, "STREAM_THRESHOLD", 100)
+    monkeypatch.setattr(json_display, "_CHUNK_LINES", 10)
+    raw_text = orjson.dumps([{"id": str(i)} for i in range(20)], option=orjson.OPT_INDENT_2).decode()
+    console = Console()
+    printed = []
+    monkeypatch.setattr(console, "print", lambda renderable: printed.append(renderable))
+
+    print_json(console, raw_text, theme="default")
+
+    assert len(printed) == len(raw_text.splitlines()) // 10 + 1
+    assert "\n".join(syntax.code.rstrip("\n") for syntax in printed) == raw_text
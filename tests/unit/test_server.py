@@ -1,9 +1,23 @@
+import orjson
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from src.n8n_mcp.server import N8nMcpServer, get_tool_definitions
 from src.n8n_mcp.config import Settings, N8nConfig, McpConfig, LoggingConfig, PerformanceConfig
 from src.n8n_mcp.client import WorkflowModel
 
+CLIENT_METHODS = (
+    "create_workflow",
+    "get_workflow",
+    "list_workflows",
+    "search_workflows",
+    "update_workflow",
+    "delete_workflow",
+    "activate_workflow",
+    "deactivate_workflow",
+    "health_check",
+)
+
 @pytest.fixture
 def mock_settings():
     """Fixture for Settings."""
@@ -18,8 +32,8 @@ def mock_settings():
 async def mcp_server(mock_settings):
     """Fixture for N8nMcpServer."""
     server = N8nMcpServer(mock_settings)
-    # Mock the n8n_client
-    server.n8n_client = AsyncMock()
+    # Stub only the client coroutines the handlers call
+    server.n8n_client = SimpleNamespace(**{name: AsyncMock() for name in CLIENT_METHODS})
     yield server
 
 @pytest.mark.asyncio
@@ -46,8 +60,98 @@ async def test_handle_get_workflow_not_found(mcp_server: N8nMcpServer):
     mcp_server.n8n_client.get_workflow.assert_called_once_with("non_existent_id", use_cache=True)
     assert "Workflow not found" in result[0].text
 
+@pytest.mark.asyncio
+async def test_handle_get_workflow_success(mcp_server: N8nMcpServer):
+    """Test get workflow handler returns the serialized workflow."""
+    workflow = WorkflowModel(id="123", name="Existing", nodes=[{"name": "Start"}], connections={})
+    mcp_server.n8n_client.get_workflow.return_value = workflow
+
+    result = await mcp_server._handle_get_workflow({"workflow_id": "123"})
+
+    assert orjson.loads(result[0].text) == {"success": True, "workflow": workflow.model_dump(mode="json")}
+
+@pytest.mark.asyncio
+async def test_handle_update_workflow_full_body_skips_fetch(mcp_server: N8nMcpServer):
+    """Test update handler does not fetch the workflow when a full body is given."""
+    mcp_server.n8n_client.update_workflow.return_value = WorkflowModel(id="123", name="Renamed")
+
+    args = {"workflow_id": "123", "name": "Renamed", "nodes": [], "connections": {}}
+    result = await mcp_server._handle_update_workflow(args)
+
+    mcp_server.n8n_client.get_workflow.assert_not_called()
+    sent = mcp_server.n8n_client.update_workflow.call_args.args[1]
+    assert sent.fast_dump() == {"name": "Renamed", "nodes": [], "connections": {}}
+    assert "Workflow 'Renamed' updated successfully" in result[0].text
+
+@pytest.mark.asyncio
+async def test_handle_update_workflow_partial_merges_existing(mcp_server: N8nMcpServer):
+    """Test update handler merges a partial update into the existing workflow."""
+    mcp_server.n8n_client.get_workflow.return_value = WorkflowModel(
+        id="123", name="Old", nodes=[{"name": "Start"}], connections={}
+    )
+    mcp_server.n8n_client.update_workflow.return_value = WorkflowModel(id="123", name="New")
+
+    await mcp_server._handle_update_workflow({"workflow_id": "123", "name": "New"})
+
+    mcp_server.n8n_client.get_workflow.assert_called_once_with("123")
+    sent = mcp_server.n8n_client.update_workflow.call_args.args[1]
+    assert sent.name == "New"
+    assert sent.nodes == [{"name": "Start"}]
+
+@pytest.mark.asyncio
+async def test_call_tool_unknown_tool(mcp_server: N8nMcpServer):
+    """Test call_tool reports unknown tool names."""
+    result = await mcp_server._call_tool("no_such_tool", {})
+
+    assert result[0].text == "Unknown tool: no_such_tool"
+
+@pytest.mark.asyncio
+async def test_handler_argument_validation(mcp_server: N8nMcpServer):
+    """Test handlers reject missing or mistyped arguments before calling the client."""
+    missing = await mcp_server._handle_delete_workflow({})
+    invalid = await mcp_server._handle_search_workflows({"query": "x", "limit": "many"})
+
+    assert missing[0].text == "Missing required field: workflow_id"
+    missing.append("corrupted")
+    assert [content.text for content in await mcp_server._handle_activate_workflow({})] == [
+        "Missing required field: workflow_id"
+    ]
+    assert invalid[0].text.startswith("Invalid value for field limit")
+    mcp_server.n8n_client.delete_workflow.assert_not_called()
+    mcp_server.n8n_client.search_workflows.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_handle_activate_workflow_escapes_id(mcp_server: N8nMcpServer):
+    """Test the templated activate response stays valid JSON for awkward IDs."""
+    mcp_server.n8n_client.activate_workflow.return_value = True
+    workflow_id = 'a"b\\c'
+
+    result = await mcp_server._handle_activate_workflow({"workflow_id": workflow_id})
+
+    assert orjson.loads(result[0].text) == {
+        "success": True,
+        "message": f"Workflow '{workflow_id}' activated successfully",
+        "workflow_id": workflow_id,
+        "active": True,
+    }
+
+@pytest.mark.asyncio
+async def test_handle_health_check_error(mcp_server: N8nMcpServer):
+    """Test health check handler reports client errors as unhealthy."""
+    mcp_server.n8n_client.health_check.side_effect = RuntimeError("boom")
+
+    result = await mcp_server._handle_health_check({})
+
+    assert orjson.loads(result[0].text) == {
+        "success": False,
+        "healthy": False,
+        "error": "boom",
+        "endpoint": "Unknown",
+    }
+
 def test_get_tool_definitions():
     """Test the static tool definitions."""
     tools = get_tool_definitions()
     assert len(tools) > 0
-    assert tools[0].name == "create_workflow"
\ No newline at end of file
+    assert tools[0].name == "create_workflow"
+    assert get_tool_definitions() is tools